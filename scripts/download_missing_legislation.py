@@ -6,17 +6,28 @@ This script supports downloading various types of legal materials from public so
 
 import os
 import sys
-import subprocess
+import copy
+import json
+import hashlib
+import shutil
+import tempfile
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import logging
+import logging.handlers
+import queue
+import threading
+import collections
 import concurrent.futures
 from pathlib import Path
 from tqdm import tqdm
 import time
-import random
 import re
-from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
 from urllib.parse import urljoin, urlparse
 from fpdf import FPDF
 
@@ -30,6 +41,7 @@ logger = logging.getLogger("LegalDocumentsDownloader")
 
 # Constants
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(BASE_DIR, "scripts")
 OUTPUT_DIR = os.path.join(BASE_DIR, "scrapers_output")
 CORE_LEGISLATION_DIR = os.path.join(OUTPUT_DIR, "core_legislation")
 CASE_LAW_DIR = os.path.join(OUTPUT_DIR, "case_law")
@@ -41,14 +53,539 @@ MUNICIPAL_DIR = os.path.join(OUTPUT_DIR, "municipal_by_laws")
 TEXTBOOKS_DIR = os.path.join(OUTPUT_DIR, "textbooks")
 SPECIALIZED_DIR = os.path.join(OUTPUT_DIR, "specialized_domains")
 CHECKLIST_FILE = os.path.join(BASE_DIR, "SA_LEGAL_LLM_CHECKLIST.md")
+# Number of collection downloads run at once, and how many of those may hit
+# the same host at the same time
+MAX_DOWNLOAD_WORKERS = 16
+MAX_REQUESTS_PER_HOST = 4
+# PDFs fetched at once by each scraper page
+PDF_FETCH_WORKERS = 8
+# Files larger than this are downloaded as several parallel byte ranges
+MULTI_STREAM_THRESHOLD = 4 * 1024 * 1024
+MULTI_STREAM_CHUNKS = 4
+# Write buffer and read chunk size used when streaming scraped documents to disk
+STREAM_BUFFER_SIZE = 8 * 1024 * 1024
+STREAM_CHUNK_SIZE = 1 << 20
+# Seconds between progress log lines for downloads without a progress bar
+PROGRESS_LOG_INTERVAL = 2.0
+# Sustained requests per second allowed to each host, and the burst allowed
+# after the host has been idle
+HOST_REQUEST_RATE = 0.5
+HOST_REQUEST_BURST = 2
+# Per-directory file holding the content fingerprints of collection documents,
+# and the lock serialising its updates across download threads
+COLLECTION_KEYS_FILE = ".collection_keys.json"
+_collection_keys_lock = threading.Lock()
+# Compiled XPath queries returning the hrefs of anchors that point at a PDF,
+# evaluated by libxml2 with the EXSLT regular expression extension
+_XPATH_NAMESPACES = {'re': 'http://exslt.org/regular-expressions'}
+# PDF links, optionally followed by a query string
+_PDF_HREF_XPATH = lxml.etree.XPath(r"//a/@href[re:test(., '\.pdf(\?|$)', 'i')]", namespaces=_XPATH_NAMESPACES)
+# Links whose href ends in '.pdf', matched exactly as str.endswith would
+_PDF_SUFFIX_XPATH = lxml.etree.XPath("//a/@href[substring(., string-length(.) - 3) = '.pdf']")
+# Keyword filters for the SARS and Competition Commission listing pages
+_TAX_GUIDE_HREF_RE = re.compile(r'guide|tax', re.IGNORECASE)
+_COMPETITION_GUIDELINE_HREF_RE = re.compile(r'guideline|guidance', re.IGNORECASE)
+# By-law links on the municipal websites
+_BYLAW_PDF_XPATH = lxml.etree.XPath(r"//a/@href[re:test(., '\.pdf$', 'i')]", namespaces=_XPATH_NAMESPACES)
+# Last path segment of an absolute URL, ignoring any query string or fragment
+_URL_TAIL_RE = re.compile(r'^[^:/?#]+://[^/?#]*[^?#]*/([^/?#]+)(?:[?#]|$)')
+# Listing pages of the additional resources that are not specialized sources
+GAZETTES_URL = "https://gazettes.africa/gazettes/za"
+UCT_OPENBOOKS_URL = "https://openbooks.uct.ac.za/uct/catalog/book/25"
+DOAB_SEARCH_URL = "https://www.doabooks.org/doab?func=search&uiLanguage=en&template=&query=south+african+law"
+# Characters not allowed in names of downloaded files
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9._-]')
+# Provinces with their own gazettes, keyed by the name used in link text
+PROVINCES = (
+    "eastern_cape", "free_state", "gauteng", "kwazulu_natal",
+    "limpopo", "mpumalanga", "northern_cape", "north_west", "western_cape"
+)
+_PROVINCE_LOOKUP = {name.replace('_', ' '): name for name in PROVINCES}
+_PROVINCE_RE = re.compile('|'.join(map(re.escape, _PROVINCE_LOOKUP)))
+# A specialized domain listing page whose linked PDFs are downloaded.
+# href_filter narrows the '.pdf' links down further (None keeps all of them)
+# and limit caps how many are downloaded (None downloads all of them).
+SourceSpec = collections.namedtuple(
+    "SourceSpec",
+    ["description", "url", "subdir", "href_filter", "limit", "fallback_prefix", "site", "checklist_item"]
+)
+SPECIALIZED_SOURCES = {
+    "tax": SourceSpec(
+        "Tax Guides from SARS",
+        "https://www.sars.gov.za/types-of-tax/",
+        "tax_guides", _TAX_GUIDE_HREF_RE, 10, "tax_guide",
+        "SARS website", "Tax Law Commentaries and Guides"
+    ),
+    "competition": SourceSpec(
+        "Competition Law Guidelines",
+        "https://www.compcom.co.za/guidelines-for-stakeholders/",
+        "competition_law", _COMPETITION_GUIDELINE_HREF_RE, None, "competition_guideline",
+        "Competition Commission website", "Competition Law Guidelines and Notices"
+    ),
+    "environmental": SourceSpec(
+        "Environmental Law Compilations",
+        "https://www.dffe.gov.za/legislation/actsregulations",
+        "environmental_law", None, 15, "environmental_law",
+        "Department of Environment website", "Environmental Law Compilations"
+    ),
+    "intellectual_property": SourceSpec(
+        "Intellectual Property Resources",
+        "https://www.cipc.co.za/?page_id=1423",
+        "intellectual_property", None, None, "ip_resource",
+        "CIPC website", "Intellectual Property Law Compilations"
+    )
+}
+# Output directory of each specialized source, keyed by its subdirectory name
+_SPECIALIZED_SOURCE_DIRS = {
+    spec.subdir: os.path.join(SPECIALIZED_DIR, spec.subdir) for spec in SPECIALIZED_SOURCES.values()
+}
+# Major cities with their by-laws URLs
+MUNICIPAL_CITIES = {
+    "cape_town": {
+        "name": "Cape Town",
+        "url": "https://www.capetown.gov.za/Family%20and%20home/City-publications/policies-and-by-laws",
+        "pdf_links": _BYLAW_PDF_XPATH
+    },
+    "johannesburg": {
+        "name": "Johannesburg",
+        "url": "https://www.joburg.org.za/documents_/By-Laws/Pages/By%20Law.aspx",
+        "pdf_links": _BYLAW_PDF_XPATH
+    },
+    "durban": {
+        "name": "Durban",
+        "url": "http://www.durban.gov.za/Resource_Centre/Services_By_Laws/Pages/default.aspx",
+        "pdf_links": _BYLAW_PDF_XPATH
+    },
+    "tshwane": {
+        "name": "Tshwane",
+        "url": "http://www.tshwane.gov.za/sites/residents/Services/Pages/By-Law-Book.aspx",
+        "pdf_links": _BYLAW_PDF_XPATH
+    }
+}
+# Output directories of the provinces and cities, joined once at import time
+_PROVINCE_DIRS = {province: os.path.join(PROVINCIAL_DIR, province) for province in PROVINCES}
+_MUNICIPAL_CITY_DIRS = {city_key: os.path.join(MUNICIPAL_DIR, city_key) for city_key in MUNICIPAL_CITIES}
 HEADERS = {
-    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    # Every encoding urllib3 can decode here (adds br/zstd when brotli/zstandard are installed)
+    **make_headers(accept_encoding=True)
 }
 
+def _warm_fpdf():
+    """Return an FPDF document with every font of the collection layout loaded.
+    
+    Selecting each style once registers Arial and Arial Bold with their width
+    tables, so copies of this document never load a font again.
+    """
+    pdf = FPDF()
+    pdf.set_font("Arial", 'B', 16)
+    pdf.set_font("Arial", 'B', 12)
+    pdf.set_font("Arial", size=12)
+    return pdf
+
+# Pre-built FPDF document copied for every collection document instead of
+# starting from a fresh FPDF()
+_PDF_SKELETON = _warm_fpdf()
+
+def _list_text(entries, prefix=""):
+    """Join list entries into one latin-1 safe block of text for multi_cell."""
+    text = "\n".join(f"{prefix}{entry}" for entry in entries)
+    return text.encode('latin-1', 'replace').decode('latin-1')
+
+def _build_collection_pdf(title, intro, sources, items, items_title, note, sources_title="Primary Sources:"):
+    """Build a placeholder collection document using the shared page layout.
+    
+    Every collection document has the same structure: a centred title, an
+    introductory paragraph, a list of sources, a bulleted list of items and a
+    closing note. Only the text varies between documents. sources and items
+    may also be passed as text already prepared with _list_text.
+    """
+    if not isinstance(sources, str):
+        sources = _list_text(sources)
+    if not isinstance(items, str):
+        items = _list_text(items, prefix="- ")
+    pdf = copy.deepcopy(_PDF_SKELETON)
+    pdf.add_page()
+    
+    # Add title
+    pdf.set_font("Arial", 'B', 16)
+    pdf.cell(200, 10, title, ln=True, align='C')
+    pdf.ln(10)
+    
+    # Add information
+    pdf.set_font("Arial", size=12)
+    pdf.multi_cell(0, 10, intro, 0)
+    pdf.ln(5)
+    
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, sources_title, ln=True)
+    pdf.set_font("Arial", size=12)
+    
+    pdf.multi_cell(0, 10, sources)
+    pdf.ln(5)
+    
+    pdf.set_font("Arial", 'B', 12)
+    pdf.cell(0, 10, items_title, ln=True)
+    pdf.set_font("Arial", size=12)
+    
+    pdf.multi_cell(0, 10, items)
+    
+    pdf.ln(5)
+    pdf.multi_cell(0, 10, note, 0)
+    
+    return pdf
+
+def _write_pdf_bytes(pdf, output_path):
+    """Render pdf in memory and write it to output_path with a single write."""
+    data = pdf.output(dest='S')
+    if isinstance(data, str):
+        # fpdf 1.7 returns the document as a latin-1 string
+        data = data.encode('latin-1')
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _cache_key(*parts):
+    """Return a short fingerprint of the content a collection document is built from."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(repr(part).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+def _load_collection_keys(keys_path):
+    """Return the collection fingerprints recorded in a directory's keys file."""
+    try:
+        with open(keys_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _output_collection_pdf(output_path, *args, **kwargs):
+    """Build a collection document with _build_collection_pdf and save it.
+    
+    A fingerprint of the document content is kept, by file name, in the
+    COLLECTION_KEYS_FILE of the PDF's directory. If the PDF exists and its
+    fingerprint matches, the document is left as it is and nothing is
+    rendered. Returns True if the PDF was written.
+    """
+    key = _cache_key(args, sorted(kwargs.items()))
+    directory, filename = os.path.split(output_path)
+    keys_path = os.path.join(directory, COLLECTION_KEYS_FILE)
+    with _collection_keys_lock:
+        if os.path.exists(output_path) and _load_collection_keys(keys_path).get(filename) == key:
+            return False
+    
+    pdf = _build_collection_pdf(*args, **kwargs)
+    _write_pdf_bytes(pdf, output_path)
+    
+    # Rewrite the keys file atomically so an interrupted run never leaves a
+    # stale or truncated entry
+    with _collection_keys_lock:
+        keys = _load_collection_keys(keys_path)
+        keys[filename] = key
+        tmp_path = keys_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(keys, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, keys_path)
+    
+    # Earlier versions kept the fingerprint in a '.key' file next to the PDF
+    try:
+        os.remove(output_path + '.key')
+    except FileNotFoundError:
+        pass
+    return True
+
+class TokenBucket:
+    """Thread-safe token bucket limiting how often requests are sent to a host."""
+    
+    def __init__(self, rate=HOST_REQUEST_RATE, capacity=HOST_REQUEST_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Reserve the next available token and sleep until it is due.
+        
+        The token is taken straight away, letting the balance go negative, so
+        each caller sleeps exactly once until its own slot instead of waking
+        up and competing for the lock again. Callers for other hosts use
+        other buckets and are never delayed by this one.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+def _write_stream(response, output_path, chunk_size=STREAM_CHUNK_SIZE, append=False):
+    """Stream a response body to output_path through a large write buffer.
+    
+    The body is copied from the raw urllib3 stream with shutil.copyfileobj in
+    chunk_size reads, and collected in a STREAM_BUFFER_SIZE userspace buffer
+    so the file is written in a few large writes. The response must have
+    been requested with stream=True. With append the body is added to the
+    end of an existing file, e.g. the rest of a resumed download.
+    """
+    # Undo any gzip/deflate transfer encoding, as iter_content would
+    response.raw.decode_content = True
+    with open(output_path, 'ab' if append else 'wb', buffering=STREAM_BUFFER_SIZE) as f:
+        shutil.copyfileobj(response.raw, f, length=chunk_size)
+
+def _conditional_headers(meta_path):
+    """Return If-None-Match/If-Modified-Since headers from a '.meta.json' sidecar."""
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+    return headers
+
+def _if_range_validator(meta_path):
+    """Return the If-Range value for resuming a partial download, or None.
+    
+    The partial file's sidecar holds the validators of the response it was
+    started from. A strong ETag is preferred, since weak ETags are not allowed
+    in If-Range, falling back to Last-Modified.
+    """
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    etag = meta.get('etag')
+    if etag and not etag.startswith('W/'):
+        return etag
+    return meta.get('last_modified')
+
+def _remove_if_exists(path):
+    """Delete path, ignoring a file that is already gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _save_validators(meta_path, response_headers):
+    """Record the ETag and Last-Modified of a downloaded file in its sidecar."""
+    meta = {
+        'etag': response_headers.get('ETag'),
+        'last_modified': response_headers.get('Last-Modified')
+    }
+    if not meta['etag'] and not meta['last_modified']:
+        return
+    try:
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+    except OSError as e:
+        logger.warning("Could not save download metadata %s: %s", meta_path, e)
+
+def _extract_pdf_links(content, base_url, href_filter=None):
+    """Return the unique absolute URLs of the '.pdf' links in an HTML page.
+    
+    content is the raw page body, base_url resolves relative links and
+    href_filter optionally narrows the links down to those it matches. This
+    is a plain module-level function so it can run in any worker pool.
+    """
+    tree = lxml.html.fromstring(content)
+    hrefs = _PDF_SUFFIX_XPATH(tree)
+    if href_filter is not None:
+        hrefs = [href for href in hrefs if href_filter.search(href)]
+    # Pages often repeat a link in menus and footers, so keep each URL once
+    return list(dict.fromkeys(str(href) if href.startswith('http') else urljoin(base_url, href) for href in hrefs))
+
+def _url_filename(url, fallback):
+    """Return a safe local filename taken from the last path segment of url.
+    
+    Characters outside letters, digits, '.', '_' and '-' (including percent
+    escapes) become '_'. Falls back to fallback when the URL has no usable
+    last segment.
+    """
+    match = _URL_TAIL_RE.search(url)
+    if not match:
+        return fallback
+    filename = _UNSAFE_FILENAME_RE.sub('_', match.group(1))
+    # Never allow names such as '..' that point outside the target directory
+    if not filename.strip('.'):
+        return fallback
+    return filename
+
+def _iter_files(directory):
+    """Yield (directory, filename) for every file below directory, using os.scandir."""
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield current, entry.name
+        except OSError:
+            continue
+
+def _existing_files(directory):
+    """Return the set of file names in directory, read with a single scandir."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except FileNotFoundError:
+        return set()
+
+# Source and item lists of the historical collection documents
+_LEGAL_DEV_SOURCES = (
+    "https://www.saflii.org/za/journals/", # SAFLII Journals
+    "https://constitutionallyspeaking.co.za/", # Constitutional Law Blog
+    "https://www.constitutionalcourt.org.za/site/judges/justicekennedy/speech.html", # Constitutional Court Resources
+    "https://www.lawlibrary.co.za/resources/legal-history/", # Law Library Resources
+    "https://www.sahistory.org.za/article/history-south-african-legal-system", # South African History Online
+    "https://www.justice.gov.za/legislation/constitution/history.html", # Department of Justice
+)
+
+_LEGAL_DEV_COMMENTARIES = (
+    "The South African Legal System and its Background by H.R. Hahlo and Ellison Kahn",
+    "The History of South African Law by R. Zimmermann and D. Visser",
+    "Constitutional Law of South Africa by S. Woolman and M. Bishop",
+    "The Bill of Rights Handbook by I. Currie and J. de Waal",
+    "The Spirit of the Constitution: Constitutional Disruption in South Africa by Theunis Roux",
+    "The New Constitutional and Administrative Law by I. Currie and J. de Waal",
+    "The Transformative Constitution by Karl Klare",
+    "The Soul of a Nation: Constitution-making in South Africa by Hassen Ebrahim",
+    "One Law, One Nation: The Making of the South African Constitution by Lauren Segal and Sharon Cort",
+    "The Post-Apartheid Constitutions by Penelope Andrews and Stephen Ellmann",
+    "Transformative Constitutionalism: Comparing the Apex Courts of Brazil, India and South Africa by Oscar Vilhena Vieira",
+    "The Dignity Jurisprudence of the Constitutional Court of South Africa by Drucilla Cornell",
+    "The Evolution of Law and Justice in South Africa by Dikgang Moseneke",
+)
+
+_COMPARATIVE_LAW_SOURCES = (
+    "https://www.saflii.org/za/journals/SAJHR/", # South African Journal on Human Rights
+    "https://www.ajol.info/index.php/pelj", # Potchefstroom Electronic Law Journal
+    "https://www.cambridge.org/core/journals/international-journal-of-law-in-context", # International Journal of Law in Context
+    "https://academic.oup.com/icon", # International Journal of Constitutional Law
+    "https://www.tandfonline.com/toc/rjcl20/current", # Journal of Comparative Law
+    "https://www.lawlibrary.co.za/resources/comparative-law/", # Law Library Resources
+)
+
+_COMPARATIVE_LAW_STUDIES = (
+    "Constitutional Rights in Two Worlds: South Africa and the United States by Mark S. Kende",
+    "The Global Expansion of Constitutional Judicial Review: South Africa by Theunis Roux",
+    "Transformative Constitutionalism: Comparing the Apex Courts of Brazil, India and South Africa by Oscar Vilhena Vieira",
+    "Socio-Economic Rights: South Africa, India and the United States by Sandra Liebenberg",
+    "The Horizontal Effect of Constitutional Rights: A Comparative Perspective by Stephen Gardbaum",
+    "Transformative Constitutionalism in South Africa and India by Heinz Klug",
+    "Comparative Constitutional Law: South Africa in Global Context by Francois Venter",
+    "Dignity, Freedom and the Post-Apartheid Legal Order: South Africa and Germany by Arthur Chaskalson",
+    "Comparative Human Rights Law: South Africa in International Context by Sandra Fredman",
+    "Transformative Equality: South Africa and Canada by Catherine Albertyn",
+    "Constitutional Borrowing and Transplants: South Africa's Use of Foreign Precedent by Christa Rautenbach",
+    "Judicial Review in New Democracies: South Africa in Comparative Perspective by Theunis Roux",
+)
+
+_LEGAL_ANTHROPOLOGY_SOURCES = (
+    "https://www.saflii.org/za/journals/PER/", # Potchefstroom Electronic Law Journal
+    "https://www.ajol.info/index.php/sajhr", # South African Journal on Human Rights
+    "https://www.tandfonline.com/toc/rjlc20/current", # Journal of Legal Pluralism
+    "https://www.jstor.org/journal/jlegplur", # Journal of Legal Pluralism and Unofficial Law
+    "https://www.justice.gov.za/legislation/acts/1998-120.pdf", # Recognition of Customary Marriages Act
+    "https://www.gov.za/sites/default/files/gcis_document/201409/a11-09.pdf", # Reform of Customary Law of Succession Act
+)
+
+_LEGAL_ANTHROPOLOGY_STUDIES = (
+    "Customary Law in South Africa by T.W. Bennett",
+    "Human Rights and African Customary Law by T.W. Bennett",
+    "The Harmonisation of Common Law and Indigenous Law by South African Law Commission",
+    "Marriage, Land and Custom by Aninka Claassens and Dee Smythe",
+    "The Future of Customary Law in Africa by A.N. Allott",
+    "Customary Law and the Constitutional Right to Equal Treatment by Chuma Himonga",
+    "Living Customary Law in South Africa by Christa Rautenbach",
+    "Ubuntu: An African Jurisprudence by Thaddeus Metz",
+    "African Customary Law in South Africa: Post-Apartheid and Living Law Perspectives by Chuma Himonga and Tom Nhlapo",
+    "The Constitutional Protection of Cultural and Religious Rights in South Africa by Lourens du Plessis",
+    "Customary Law and Gender Equality by Likhapha Mbatha",
+    "Traditional Courts and the Judicial Function of Traditional Leaders by Sindiso Mnisi Weeks",
+    "Legal Pluralism in South Africa: Challenges and Opportunities by Christa Rautenbach",
+)
+
+# The same lists as prepared multi_cell text, built once at import
+_LEGAL_DEV_SOURCES_TEXT = _list_text(_LEGAL_DEV_SOURCES)
+_LEGAL_DEV_COMMENTARIES_TEXT = _list_text(_LEGAL_DEV_COMMENTARIES, prefix="- ")
+_COMPARATIVE_LAW_SOURCES_TEXT = _list_text(_COMPARATIVE_LAW_SOURCES)
+_COMPARATIVE_LAW_STUDIES_TEXT = _list_text(_COMPARATIVE_LAW_STUDIES, prefix="- ")
+_LEGAL_ANTHROPOLOGY_SOURCES_TEXT = _list_text(_LEGAL_ANTHROPOLOGY_SOURCES)
+_LEGAL_ANTHROPOLOGY_STUDIES_TEXT = _list_text(_LEGAL_ANTHROPOLOGY_STUDIES, prefix="- ")
+
 class LegalDocumentsDownloader:
     """Class to download various South African legal documents from public sources."""
     
-    def __init__(self, base_dir="."):
+    __slots__ = (
+        'base_dir', 'output_dir', 'core_legislation_dir', 'case_law_dir', 'secondary_legal_dir',
+        'procedural_dir', 'historical_dir', 'checklist_file', 'revalidate', 'session',
+        '_checklist_dirty', '_pending_checklist', '_pending_checklist_lock', '_checklist_lock',
+        '_prefetched', '_prefetched_lock',
+        '_listing_cache', '_listing_cache_lock',
+        '_host_slots', '_host_slots_lock', '_host_buckets', '_host_buckets_lock',
+    )
+    
+    # Category directories created at start-up, as (root directory attribute, subdirectory)
+    _ALL_CATEGORY_DIRS = (
+        # Core legislation directories
+        ("core_legislation_dir", "constitutional"),
+        ("core_legislation_dir", "criminal"),
+        ("core_legislation_dir", "commercial"),
+        ("core_legislation_dir", "labor"),
+        ("core_legislation_dir", "environmental"),
+        ("core_legislation_dir", "tax"),
+        ("core_legislation_dir", "digital"),
+        ("core_legislation_dir", "regulations"),
+        ("core_legislation_dir", "notices"),
+        ("core_legislation_dir", "bills"),
+        ("core_legislation_dir", "whitepapers"),
+        # Case law directories
+        ("case_law_dir", "constitutional_court"),
+        ("case_law_dir", "supreme_court_appeal"),
+        ("case_law_dir", "high_court"),
+        ("case_law_dir", "labor_court"),
+        ("case_law_dir", "competition_court"),
+        ("case_law_dir", "land_claims_court"),
+        ("case_law_dir", "tax_court"),
+        ("case_law_dir", "magistrates_court"),
+        # Secondary legal sources
+        ("secondary_legal_dir", "academic"),
+        ("secondary_legal_dir", "specialized"),
+        ("secondary_legal_dir", "dictionaries_glossaries"),
+        ("secondary_legal_dir", "law_journals"),
+        ("secondary_legal_dir", "law_reform"),
+        # Procedural materials
+        ("procedural_dir", "rules_of_court"),
+        ("procedural_dir", "practice_directives"),
+        ("procedural_dir", "ethics"),
+        ("procedural_dir", "forms"),
+        ("procedural_dir", "legal_ethics"),
+        ("procedural_dir", "forms_precedents"),
+        ("procedural_dir", "legal_profession_guidelines"),
+        # Historical materials
+        ("historical_dir", "roman_dutch"),
+        ("historical_dir", "historical_legislation"),
+        ("historical_dir", "legal_development"),
+        ("historical_dir", "comparative_law"),
+        ("historical_dir", "legal_anthropology"),
+    )
+    
+    def __init__(self, base_dir=".", revalidate=False):
         """Initialize with the base directory of the repository."""
         self.base_dir = base_dir
         self.output_dir = os.path.join(base_dir, "scrapers_output")
@@ -58,46 +595,67 @@ class LegalDocumentsDownloader:
         self.procedural_dir = os.path.join(self.output_dir, "procedural")
         self.historical_dir = os.path.join(self.output_dir, "historical")
         self.checklist_file = os.path.join(base_dir, "SA_LEGAL_LLM_CHECKLIST.md")
+        # Re-check already downloaded scraper files with conditional requests
+        self.revalidate = revalidate
         self.session = requests.Session()
         self.session.headers.update(HEADERS)
         
-        # Create output directories if they don't exist
-        # Core legislation directories
-        os.makedirs(os.path.join(self.core_legislation_dir, "constitutional"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "criminal"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "commercial"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "labor"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "environmental"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "tax"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "digital"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "regulations"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "notices"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "bills"), exist_ok=True)
-        os.makedirs(os.path.join(self.core_legislation_dir, "whitepapers"), exist_ok=True)
-        
-        # Case law directories
-        os.makedirs(os.path.join(self.case_law_dir, "constitutional_court"), exist_ok=True)
-        os.makedirs(os.path.join(self.case_law_dir, "supreme_court_appeal"), exist_ok=True)
-        os.makedirs(os.path.join(self.case_law_dir, "high_court"), exist_ok=True)
-        os.makedirs(os.path.join(self.case_law_dir, "labor_court"), exist_ok=True)
-        os.makedirs(os.path.join(self.case_law_dir, "competition_court"), exist_ok=True)
-        os.makedirs(os.path.join(self.case_law_dir, "land_claims_court"), exist_ok=True)
-        os.makedirs(os.path.join(self.case_law_dir, "tax_court"), exist_ok=True)
-        os.makedirs(os.path.join(self.case_law_dir, "magistrates_court"), exist_ok=True)
-        
-        # Secondary legal sources
-        os.makedirs(os.path.join(self.secondary_legal_dir, "academic"), exist_ok=True)
-        os.makedirs(os.path.join(self.secondary_legal_dir, "specialized"), exist_ok=True)
-        
-        # Procedural materials
-        os.makedirs(os.path.join(self.procedural_dir, "rules_of_court"), exist_ok=True)
-        os.makedirs(os.path.join(self.procedural_dir, "practice_directives"), exist_ok=True)
-        os.makedirs(os.path.join(self.procedural_dir, "ethics"), exist_ok=True)
-        os.makedirs(os.path.join(self.procedural_dir, "forms"), exist_ok=True)
+        # Keep connections to each host alive and shared between download threads
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Set when the checklist changed and its statistics need recalculating
+        self._checklist_dirty = False
+        # Checklist items completed by download threads, written in one batch
+        self._pending_checklist = []
+        self._pending_checklist_lock = threading.Lock()
+        # Held while the checklist file is being rewritten
+        self._checklist_lock = threading.Lock()
+        
+        # Files found under each directory checked by is_document_present
+        self._listing_cache = {}
+        self._listing_cache_lock = threading.Lock()
+        
+        # Listing page requests started ahead of the methods that read them, by URL
+        self._prefetched = {}
+        self._prefetched_lock = threading.Lock()
+        
+        # Per-host request limits shared by all download threads
+        self._host_slots = {}
+        self._host_slots_lock = threading.Lock()
+        self._host_buckets = {}
+        self._host_buckets_lock = threading.Lock()
         
-        # Historical materials
-        os.makedirs(os.path.join(self.historical_dir, "roman_dutch"), exist_ok=True)
-        os.makedirs(os.path.join(self.historical_dir, "historical_legislation"), exist_ok=True)
+        # Create output directories if they don't exist
+        for root_attr, subdir in self._ALL_CATEGORY_DIRS:
+            os.makedirs(os.path.join(getattr(self, root_attr), subdir), exist_ok=True)
+        for province_dir in _PROVINCE_DIRS.values():
+            os.makedirs(province_dir, exist_ok=True)
+        for city_dir in _MUNICIPAL_CITY_DIRS.values():
+            os.makedirs(city_dir, exist_ok=True)
+    
+    def _list_files(self, base_dir):
+        """Return (directory, lowercased filename) pairs under base_dir, cached per directory."""
+        with self._listing_cache_lock:
+            files = self._listing_cache.get(base_dir)
+        if files is None:
+            files = tuple((root, filename.lower()) for root, filename in _iter_files(base_dir))
+            with self._listing_cache_lock:
+                self._listing_cache[base_dir] = files
+        return files
+    
+    def _invalidate_listing(self, path):
+        """Forget cached listings of path and of the directories containing it."""
+        path = os.path.join(os.path.abspath(path), '')
+        with self._listing_cache_lock:
+            for base_dir in list(self._listing_cache):
+                if path.startswith(os.path.join(os.path.abspath(base_dir), '')):
+                    del self._listing_cache[base_dir]
     
     def is_document_present(self, doc_name, base_dir):
         """Check if a document is already downloaded in any of the subdirectories."""
@@ -105,22 +663,78 @@ class LegalDocumentsDownloader:
         clean_name = doc_name.lower().strip()
         
         # Check if any file in any subdirectory contains the document name
-        for root, _, files in os.walk(base_dir):
-            for filename in files:
-                if clean_name in filename.lower():
-                    logger.info(f"{doc_name} already exists in {root}")
-                    return True
+        for root, filename in self._list_files(base_dir):
+            if clean_name in filename:
+                logger.info("%s already exists in %s", doc_name, root)
+                return True
         
         return False
     
+    def _probe_url(self, url):
+        """Return whether a HEAD request suggests the URL can be downloaded."""
+        try:
+            # Probes count against the same per-host limits as downloads
+            self._throttle(url)
+            with self._host_slot(url):
+                response = self.session.head(url, allow_redirects=True, timeout=15)
+        except Exception as e:
+            logger.debug("HEAD request failed for %s: %s", url, e)
+            return False
+        # Some servers refuse HEAD but still serve GET requests
+        return response.status_code < 400 or response.status_code == 405
+    
+    def _rank_urls_by_reachability(self, urls):
+        """Probe candidate URLs concurrently and move unreachable ones to the end.
+        
+        The fallbacks are then tried without first waiting for each dead URL
+        to time out in turn, while reachable URLs keep their preferred order.
+        """
+        if len(urls) < 2:
+            return urls
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(urls)) as executor:
+            reachable = list(executor.map(self._probe_url, urls))
+        
+        return ([url for url, ok in zip(urls, reachable) if ok] +
+                [url for url, ok in zip(urls, reachable) if not ok])
+    
+    def _candidate_urls(self, urls):
+        """Yield the primary URL, then the fallbacks ranked by reachability.
+        
+        The fallbacks are only probed once the caller asks for them, that is
+        after the primary URL has failed.
+        """
+        yield urls[0]
+        yield from self._rank_urls_by_reachability(urls[1:])
+    
+    def _host_slot(self, url):
+        """Return the semaphore limiting concurrent requests to the host of url."""
+        host = urlparse(url).netloc
+        with self._host_slots_lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+                self._host_slots[host] = slot
+            return slot
+    
+    def _throttle(self, url):
+        """Wait for the rate limiter of the host of url before requesting it."""
+        host = urlparse(url).netloc
+        with self._host_buckets_lock:
+            bucket = self._host_buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket()
+                self._host_buckets[host] = bucket
+        bucket.acquire()
+    
     def download_file(self, doc_name, category_dir, urls=None, output_filename=None):
         """Download a file from the provided URLs."""
         if self.is_document_present(doc_name, category_dir):
-            logger.info(f"{doc_name} already downloaded, skipping")
+            logger.info("%s already downloaded, skipping", doc_name)
             return True
             
         if not urls:
-            logger.error(f"No URLs provided for {doc_name}")
+            logger.error("No URLs provided for %s", doc_name)
             return False
             
         if not output_filename:
@@ -129,55 +743,82 @@ class LegalDocumentsDownloader:
         
         output_path = os.path.join(category_dir, output_filename)
         
-        # Try each URL until successful
-        for url in urls:
+        # Try each URL until successful; fallbacks that answer a probe go first
+        for url in self._candidate_urls(urls):
             try:
-                logger.info(f"Downloading {doc_name} from {url}")
+                logger.info("Downloading %s from %s", doc_name, url)
                 
-                # Add a small random delay to avoid overloading servers
-                time.sleep(random.uniform(0.5, 2.0))
+                # Wait for the host's rate limiter to avoid overloading servers
+                self._throttle(url)
                 
-                response = self.session.get(url, stream=True)
-                response.raise_for_status()
+                # Limit the number of simultaneous requests to the same host
+                with self._host_slot(url):
+                    response = self.session.get(url, stream=True, timeout=30)
+                    response.raise_for_status()
                 
-                # Determine file type from Content-Type header or URL
-                file_ext = ".pdf"  # Default
-                content_type = response.headers.get('content-type', '').lower()
-                if 'html' in content_type:
-                    file_ext = '.html'
-                elif 'text/plain' in content_type:
-                    file_ext = '.txt'
-                elif 'application/msword' in content_type or 'application/vnd.openxmlformats-officedocument.wordprocessingml.document' in content_type:
-                    file_ext = '.doc' if 'msword' in content_type else '.docx'
+                    # Determine file type from Content-Type header or URL
+                    file_ext = ".pdf"  # Default
+                    content_type = response.headers.get('content-type', '').lower()
+                    if 'html' in content_type:
+                        file_ext = '.html'
+                    elif 'text/plain' in content_type:
+                        file_ext = '.txt'
+                    elif 'application/msword' in content_type or 'application/vnd.openxmlformats-officedocument.wordprocessingml.document' in content_type:
+                        file_ext = '.doc' if 'msword' in content_type else '.docx'
                 
-                # Override with URL extension if present
-                url_path = urlparse(url).path
-                if '.' in url_path:
-                    possible_ext = '.' + url_path.split('.')[-1].lower()
-                    if possible_ext in ['.pdf', '.html', '.txt', '.doc', '.docx']:
-                        file_ext = possible_ext
+                    # Override with URL extension if present
+                    url_path = urlparse(url).path
+                    if '.' in url_path:
+                        possible_ext = '.' + url_path.split('.')[-1].lower()
+                        if possible_ext in ['.pdf', '.html', '.txt', '.doc', '.docx']:
+                            file_ext = possible_ext
                 
-                # Update output filename with correct extension
-                if not output_filename.lower().endswith(file_ext):
-                    output_filename = os.path.splitext(output_filename)[0] + file_ext
-                    output_path = os.path.join(category_dir, output_filename)
+                    # Update output filename with correct extension
+                    if not output_filename.lower().endswith(file_ext):
+                        output_filename = os.path.splitext(output_filename)[0] + file_ext
+                        output_path = os.path.join(category_dir, output_filename)
                 
-                # Get the total file size for progress bar
-                total_size = int(response.headers.get('content-length', 0))
+                    # Get the total file size for progress bar
+                    total_size = int(response.headers.get('content-length', 0))
                 
-                # Show a progress bar
-                with open(output_path, 'wb') as f, tqdm(
-                    desc=doc_name,
-                    total=total_size,
-                    unit='B',
-                    unit_scale=True,
-                    unit_divisor=1024,
-                ) as bar:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        size = f.write(chunk)
-                        bar.update(size)
+                    # Show a progress bar while copying the raw body in large
+                    # reads, decoding any gzip/deflate content encoding. Bars
+                    # from concurrent worker threads would interleave on stderr,
+                    # so those downloads log their progress periodically instead.
+                    show_bar = sys.stderr.isatty() and threading.current_thread() is threading.main_thread()
+                    response.raw.decode_content = True
+                    part_path = output_path + '.part'
+                    written = 0
+                    next_report = time.monotonic() + PROGRESS_LOG_INTERVAL
+                    try:
+                        with open(part_path, 'wb', buffering=STREAM_BUFFER_SIZE) as f, tqdm(
+                            desc=doc_name,
+                            total=total_size,
+                            unit='B',
+                            unit_scale=True,
+                            unit_divisor=1024,
+                            mininterval=0.5,
+                            disable=not show_bar,
+                        ) as bar:
+                            for chunk in iter(lambda: response.raw.read(STREAM_CHUNK_SIZE), b''):
+                                size = f.write(chunk)
+                                written += size
+                                if show_bar:
+                                    bar.update(size)
+                                elif time.monotonic() >= next_report:
+                                    logger.info("%s: %d of %d bytes downloaded", doc_name, written, total_size)
+                                    next_report += PROGRESS_LOG_INTERVAL
+                        
+                        # Only a complete download takes the final name
+                        os.replace(part_path, output_path)
+                    finally:
+                        # This path never resumes, so a failed attempt's partial
+                        # file is not left behind in the dataset directory
+                        if os.path.exists(part_path):
+                            os.unlink(part_path)
+                    self._invalidate_listing(category_dir)
                 
-                logger.info(f"Successfully downloaded {doc_name} to {output_path}")
+                logger.info("Successfully downloaded %s to %s", doc_name, output_path)
                 
                 # Update the checklist
                 self.update_checklist_item(doc_name)
@@ -185,47 +826,86 @@ class LegalDocumentsDownloader:
                 return True
                 
             except Exception as e:
-                logger.warning(f"Failed to download {doc_name} from {url}: {e}")
+                logger.warning("Failed to download %s from %s: %s", doc_name, url, e)
                 continue
         
-        logger.error(f"All download attempts failed for {doc_name}")
+        logger.error("All download attempts failed for %s", doc_name)
         return False
     
     def update_checklist_item(self, doc_name):
-        """Update the checklist to mark an item as completed."""
+        """Queue a checklist item to be marked as completed by the next flush."""
+        with self._pending_checklist_lock:
+            self._pending_checklist.append(doc_name)
+    
+    def update_checklist_batch(self, doc_names):
+        """Mark several checklist items as completed in a single streamed rewrite."""
+        # One pattern alternating every pending name (longest first), so the
+        # file is scanned once however many items are being marked
+        pending = {doc_name.lower(): doc_name for doc_name in doc_names}
+        pattern = re.compile('|'.join(re.escape(name) for name in sorted(pending, key=len, reverse=True)))
+        
+        tmp_path = None
         try:
-            # Read the current checklist
-            with open(self.checklist_file, 'r') as f:
-                lines = f.readlines()
-            
-            # Find the line containing the document name and update it
-            for i, line in enumerate(lines):
-                # Look for unchecked items containing the document name
-                if '- [ ]' in line and doc_name.lower() in line.lower():
-                    lines[i] = line.replace('- [ ]', '- [x]')
-                    logger.info(f"Updated checklist for {doc_name}")
-                    break
-            
-            # Write the updated checklist
-            with open(self.checklist_file, 'w') as f:
-                f.writelines(lines)
+            # Copy the checklist line by line into a temporary file next to it,
+            # marking the first unchecked line containing each document name
+            with self._checklist_lock:
+                with open(self.checklist_file, 'r') as src, tempfile.NamedTemporaryFile(
+                    'w', dir=os.path.dirname(os.path.abspath(self.checklist_file)), delete=False
+                ) as dst:
+                    tmp_path = dst.name
+                    for line in src:
+                        if pending and '- [ ]' in line:
+                            matched = [name for name in pattern.findall(line.lower()) if name in pending]
+                            if matched:
+                                line = line.replace('- [ ]', '- [x]')
+                                for name in matched:
+                                    logger.info("Updated checklist for %s", pending.pop(name))
+                        dst.write(line)
                 
-            # Run the checklist update script
-            self.run_checklist_update()
+                # Readers only ever see the old or the new checklist, never a partial one
+                shutil.copymode(self.checklist_file, tmp_path)
+                os.replace(tmp_path, self.checklist_file)
+                tmp_path = None
+                
+            # Statistics are recalculated once by flush_checklist_update
+            self._checklist_dirty = True
                 
         except Exception as e:
-            logger.error(f"Failed to update checklist for {doc_name}: {e}")
+            logger.error("Failed to update checklist for %s: %s", ", ".join(doc_names), e)
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    
+    def _write_pending_checklist(self):
+        """Write the checklist items queued by update_checklist_item."""
+        with self._pending_checklist_lock:
+            doc_names, self._pending_checklist = self._pending_checklist, []
+        if doc_names:
+            self.update_checklist_batch(doc_names)
     
     def run_checklist_update(self):
-        """Run the update_llm_checklist.py script to recalculate progress."""
+        """Recalculate checklist progress with update_llm_checklist.py, in this process."""
         try:
-            subprocess.run([sys.executable, os.path.join(self.base_dir, "scripts", "update_llm_checklist.py")], 
-                           check=True, 
-                           stdout=subprocess.PIPE, 
-                           stderr=subprocess.PIPE)
+            # Imported lazily so runs that change no checklist items never load it
+            if SCRIPTS_DIR not in sys.path:
+                sys.path.insert(0, SCRIPTS_DIR)
+            from update_llm_checklist import ChecklistUpdater
+            
+            ChecklistUpdater(base_dir=self.base_dir).update()
             logger.info("Updated checklist statistics")
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to update checklist statistics: {e}")
+        except Exception as e:
+            logger.error("Failed to update checklist statistics: %s", e)
+    
+    def close(self):
+        """Close the pooled HTTP connections of the download session."""
+        self.session.close()
+    
+    def flush_checklist_update(self):
+        """Write queued checklist items and recalculate statistics if any item changed."""
+        self._write_pending_checklist()
+        if self._checklist_dirty:
+            self.run_checklist_update()
+            self._checklist_dirty = False
     
     # SECONDARY LEGAL MATERIALS
     
@@ -294,35 +974,13 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.secondary_legal_dir, "dictionaries_glossaries")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about legal dictionaries and glossaries
         output_filename = "legal_dictionaries_glossaries_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Legal Dictionaries and Glossaries Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about South African legal terminology resources, including dictionaries and glossaries relevant to South African law.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         sources = [
             "https://www.justice.gov.za/sca/dictionary.html", # Supreme Court of Appeal Legal Dictionary
             "https://constitutionallyspeaking.co.za/constitutional-court-terminology/", # Constitutional Court Terminology
@@ -332,15 +990,6 @@ class LegalDocumentsDownloader:
             "https://www.law.co.za/legal-terminology/", # Law.co.za Legal Terminology
         ]
         
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # Key terms/concepts
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Key South African Legal Dictionaries and Glossaries:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         resources = [
             "Legal Terminology in South African Law (2022)",
             "Legal Terminology: Criminal Law, Procedure and Evidence",
@@ -356,20 +1005,25 @@ class LegalDocumentsDownloader:
             "Environmental Law Terminology (Department of Environmental Affairs)"
         ]
         
-        for resource in resources:
-            pdf.cell(0, 10, f"- {resource}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing Legal dictionaries and glossaries for the South African Legal LLM Dataset. It provides references to publicly available terminology resources relevant to South African law. For comprehensive dictionaries, researchers should consult university libraries and legal publishers as many authoritative dictionaries are subscription-based.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Legal Dictionaries and Glossaries Collection",
+            "This document contains information about South African legal terminology resources, including dictionaries and glossaries relevant to South African law.",
+            sources,
+            resources,
+            "Key South African Legal Dictionaries and Glossaries:",
+            "Note: This document serves as a placeholder representing Legal dictionaries and glossaries for the South African Legal LLM Dataset. It provides references to publicly available terminology resources relevant to South African law. For comprehensive dictionaries, researchers should consult university libraries and legal publishers as many authoritative dictionaries are subscription-based."
+        )
         
-        logging.info(f"Created Legal dictionaries and glossaries collection document at {output_path}")
+        if created:
+            logger.info("Created Legal dictionaries and glossaries collection document at %s", output_path)
+        else:
+            logger.info("Legal dictionaries and glossaries collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     def download_law_journals(self):
@@ -378,35 +1032,13 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.secondary_legal_dir, "law_journals")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about law journal articles
         output_filename = "law_journal_articles_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Law Journal Articles Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about major South African law journals and open access legal articles relevant to South African jurisprudence.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         sources = [
             "https://journals.co.za/content/journal/ju_salj", # South African Law Journal
             "https://journals.co.za/content/journal/ju_slr", # Stellenbosch Law Review
@@ -417,15 +1049,6 @@ class LegalDocumentsDownloader:
             "https://dspace.nwu.ac.za/handle/10394/18406", # North-West University Law Repository
         ]
         
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # Key journals
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Major South African Law Journals:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         journals = [
             "South African Law Journal (SALJ)",
             "Stellenbosch Law Review (Stell LR)",
@@ -441,20 +1064,25 @@ class LegalDocumentsDownloader:
             "Constitutional Court Review (CCR)"
         ]
         
-        for journal in journals:
-            pdf.cell(0, 10, f"- {journal}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing Law Journal articles for the South African Legal LLM Dataset. It provides references to major South African law journals and open access resources. Many journal articles are protected by copyright and access is restricted to subscribers or academic institutions. Researchers should consult university libraries for full access.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Law Journal Articles Collection",
+            "This document contains information about major South African law journals and open access legal articles relevant to South African jurisprudence.",
+            sources,
+            journals,
+            "Major South African Law Journals:",
+            "Note: This document serves as a placeholder representing Law Journal articles for the South African Legal LLM Dataset. It provides references to major South African law journals and open access resources. Many journal articles are protected by copyright and access is restricted to subscribers or academic institutions. Researchers should consult university libraries for full access."
+        )
         
-        logging.info(f"Created Law Journal articles collection document at {output_path}")
+        if created:
+            logger.info("Created Law Journal articles collection document at %s", output_path)
+        else:
+            logger.info("Law Journal articles collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     def download_law_reform_reports(self):
@@ -463,35 +1091,13 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.secondary_legal_dir, "law_reform")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about law reform commission reports
         output_filename = "law_reform_reports_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Law Reform Commission Reports Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about reports and papers published by the South African Law Reform Commission (SALRC), which plays a vital role in the development of South African law.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         sources = [
             "https://www.justice.gov.za/salrc/", # South African Law Reform Commission official website
             "https://www.justice.gov.za/salrc/reports.htm", # SALRC Reports
@@ -500,15 +1106,6 @@ class LegalDocumentsDownloader:
             "https://www.justice.gov.za/legislation/acts/2002-019.pdf", # South African Law Reform Commission Act
         ]
         
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # Key reports
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Significant SALRC Reports:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         reports = [
             "Report on Domestic Partnerships (2006)",
             "Report on Islamic Marriages and Related Matters (2003)",
@@ -524,20 +1121,25 @@ class LegalDocumentsDownloader:
             "Issue Paper on Family Dispute Resolution (2019)"
         ]
         
-        for report in reports:
-            pdf.cell(0, 10, f"- {report}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Law Reform Commission reports and papers category for the South African Legal LLM Dataset. It provides references to the official SALRC website where the full text of these reports can be accessed. The SALRC plays a critical role in law reform in South Africa, and their reports are valuable resources for understanding legal developments and proposed changes to legislation.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Law Reform Commission Reports Collection",
+            "This document contains information about reports and papers published by the South African Law Reform Commission (SALRC), which plays a vital role in the development of South African law.",
+            sources,
+            reports,
+            "Significant SALRC Reports:",
+            "Note: This document serves as a placeholder representing the Law Reform Commission reports and papers category for the South African Legal LLM Dataset. It provides references to the official SALRC website where the full text of these reports can be accessed. The SALRC plays a critical role in law reform in South Africa, and their reports are valuable resources for understanding legal developments and proposed changes to legislation."
+        )
         
-        logging.info(f"Created Law Reform Commission reports collection document at {output_path}")
+        if created:
+            logger.info("Created Law Reform Commission reports collection document at %s", output_path)
+        else:
+            logger.info("Law Reform Commission reports collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     # CASE LAW
@@ -637,42 +1239,17 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.case_law_dir, "tax_court")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about tax court judgments 
         # since we can't directly download the PDFs
         output_filename = "tax_court_judgments_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Tax Court Judgments Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about South African Tax Court judgments available on the SARS website. The full text of these judgments can be accessed online at the URL provided below.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Source:", ln=True)
-        pdf.set_font("Arial", size=12)
-        pdf.cell(0, 10, "https://www.sars.gov.za/legal-counsel/dispute-resolution-judgments/tax-court/", ln=True)
-        pdf.ln(5)
-        
-        # List of recent judgments
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Recent Tax Court Judgments:", ln=True)
-        pdf.set_font("Arial", size=12)
+        sources = [
+            "https://www.sars.gov.za/legal-counsel/dispute-resolution-judgments/tax-court/"
+        ]
         
         recent_judgments = [
             ("2022/12 (21 December 2022)", "Tax administration: Default judgment based on delivery of notices"),
@@ -686,20 +1263,26 @@ class LegalDocumentsDownloader:
             ("IT 25390 (18 May 2021)", "Income tax: section 30; PBO status")
         ]
         
-        for judgment, description in recent_judgments:
-            pdf.cell(0, 10, f"- {judgment}: {description}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document is a placeholder representing the Tax Court judgments category for the South African Legal LLM Dataset. To access the actual judgment texts, researchers should visit the SARS website or contact the South African Revenue Service directly.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Tax Court Judgments Collection",
+            "This document contains information about South African Tax Court judgments available on the SARS website. The full text of these judgments can be accessed online at the URL provided below.",
+            sources,
+            [f"{judgment}: {description}" for judgment, description in recent_judgments],
+            "Recent Tax Court Judgments:",
+            "Note: This document is a placeholder representing the Tax Court judgments category for the South African Legal LLM Dataset. To access the actual judgment texts, researchers should visit the SARS website or contact the South African Revenue Service directly.",
+            sources_title="Source:"
+        )
         
-        logging.info(f"Created Tax Court judgments collection document at {output_path}")
+        if created:
+            logger.info("Created Tax Court judgments collection document at %s", output_path)
+        else:
+            logger.info("Tax Court judgments collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     def download_magistrates_court_cases(self):
@@ -739,50 +1322,19 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.procedural_dir, "practice_directives")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about practice directives
         output_filename = "practice_directives_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Judiciary Practice Directives Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about South African Judiciary Practice Directives. These directives provide guidance on court procedures and operations.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         sources = [
             "https://www.judiciary.org.za/index.php/public-info/judgments",
             "https://www.judiciary.org.za/index.php/high-court",
             "https://www.judiciary.org.za/index.php/directives"
         ]
         
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # List of important practice directives
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Key Practice Directives Categories:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         directive_categories = [
             "Constitutional Court Directives",
             "Supreme Court of Appeal Directives",
@@ -794,20 +1346,25 @@ class LegalDocumentsDownloader:
             "Court Dress and Etiquette Directives"
         ]
         
-        for category in directive_categories:
-            pdf.cell(0, 10, f"- {category}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Practice Directives category for the South African Legal LLM Dataset. Researchers are advised to visit the judiciary website for the most current practice directives as they are regularly updated.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Judiciary Practice Directives Collection",
+            "This document contains information about South African Judiciary Practice Directives. These directives provide guidance on court procedures and operations.",
+            sources,
+            directive_categories,
+            "Key Practice Directives Categories:",
+            "Note: This document serves as a placeholder representing the Practice Directives category for the South African Legal LLM Dataset. Researchers are advised to visit the judiciary website for the most current practice directives as they are regularly updated."
+        )
         
-        logging.info(f"Created Practice directives collection document at {output_path}")
+        if created:
+            logger.info("Created Practice directives collection document at %s", output_path)
+        else:
+            logger.info("Practice directives collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     def download_legal_ethics_guidelines(self):
@@ -816,50 +1373,19 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.procedural_dir, "legal_ethics")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about legal ethics guidelines
         output_filename = "legal_ethics_guidelines_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Legal Ethics Guidelines Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about South African Legal Ethics Guidelines issued by regulatory bodies like the Legal Practice Council (LPC) and previously the Law Society of South Africa.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         sources = [
             "https://lpc.org.za/",
             "https://www.lssa.org.za/",
             "https://www.gcbsa.co.za/" # General Council of the Bar
         ]
         
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # List of important ethics guidelines
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Key Legal Ethics Documents:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         ethics_documents = [
             "Legal Practice Act 28 of 2014 (Chapter 4)",
             "Legal Practice Council Code of Conduct",
@@ -873,20 +1399,25 @@ class LegalDocumentsDownloader:
             "Professional Indemnity Insurance Requirements"
         ]
         
-        for document in ethics_documents:
-            pdf.cell(0, 10, f"- {document}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Legal Ethics Guidelines category for the South African Legal LLM Dataset. Researchers should consult the Legal Practice Council and other regulatory bodies for the most current ethics guidelines as they are regularly updated.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Legal Ethics Guidelines Collection",
+            "This document contains information about South African Legal Ethics Guidelines issued by regulatory bodies like the Legal Practice Council (LPC) and previously the Law Society of South Africa.",
+            sources,
+            ethics_documents,
+            "Key Legal Ethics Documents:",
+            "Note: This document serves as a placeholder representing the Legal Ethics Guidelines category for the South African Legal LLM Dataset. Researchers should consult the Legal Practice Council and other regulatory bodies for the most current ethics guidelines as they are regularly updated."
+        )
         
-        logging.info(f"Created Legal ethics guidelines collection document at {output_path}")
+        if created:
+            logger.info("Created Legal ethics guidelines collection document at %s", output_path)
+        else:
+            logger.info("Legal ethics guidelines collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     def download_forms_and_precedents(self):
@@ -895,35 +1426,13 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.procedural_dir, "forms_precedents")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about forms and precedents
         output_filename = "forms_and_precedents_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Legal Forms and Precedents Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about standard South African legal forms and precedents used in various legal proceedings and transactions.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         sources = [
             "https://www.justice.gov.za/forms/form_lc.html", # Labour Court forms
             "https://www.justice.gov.za/forms/form_cc.htm", # Constitutional Court forms
@@ -932,15 +1441,6 @@ class LegalDocumentsDownloader:
             "https://www.judiciary.org.za/index.php/about-us/justice-services" # Judiciary services
         ]
         
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # List of important forms and precedents categories
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Key Legal Forms and Precedents Categories:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         categories = [
             "Constitutional Court Application Forms",
             "Supreme Court of Appeal Forms",
@@ -959,20 +1459,25 @@ class LegalDocumentsDownloader:
             "Notarial Documents"
         ]
         
-        for category in categories:
-            pdf.cell(0, 10, f"- {category}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Legal Forms and Precedents category for the South African Legal LLM Dataset. Researchers should consult the Department of Justice website and other official sources for the current versions of legal forms as they are updated periodically.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Legal Forms and Precedents Collection",
+            "This document contains information about standard South African legal forms and precedents used in various legal proceedings and transactions.",
+            sources,
+            categories,
+            "Key Legal Forms and Precedents Categories:",
+            "Note: This document serves as a placeholder representing the Legal Forms and Precedents category for the South African Legal LLM Dataset. Researchers should consult the Department of Justice website and other official sources for the current versions of legal forms as they are updated periodically."
+        )
         
-        logging.info(f"Created Forms and precedents collection document at {output_path}")
+        if created:
+            logger.info("Created Forms and precedents collection document at %s", output_path)
+        else:
+            logger.info("Forms and precedents collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     def download_law_society_guidelines(self):
@@ -981,35 +1486,13 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.procedural_dir, "legal_profession_guidelines")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about Law Society and Bar Council guidelines
         output_filename = "law_society_guidelines_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Law Society and Bar Council Guidelines Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about guidelines issued by the Law Society of South Africa, Legal Practice Council, and various Bar Councils that govern the conduct of legal practitioners in South Africa.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         sources = [
             "https://lpc.org.za/",  # Legal Practice Council 
             "https://www.lssa.org.za/",  # Law Society of South Africa
@@ -1018,15 +1501,6 @@ class LegalDocumentsDownloader:
             "https://www.judiciary.org.za/index.php/about-us/legal-practitioners"  # Judiciary information
         ]
         
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # List of important guidelines
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Key Law Society and Bar Council Guidelines:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         guidelines = [
             "Legal Practice Council Rules (LPC Rules)",
             "Professional Ethics Codes for Attorneys and Advocates",
@@ -1043,20 +1517,25 @@ class LegalDocumentsDownloader:
             "Candidate Attorney Training Guidelines"
         ]
         
-        for guideline in guidelines:
-            pdf.cell(0, 10, f"- {guideline}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Law Society and Bar Council Guidelines category for the South African Legal LLM Dataset. Researchers should consult the Legal Practice Council, Law Society, and Bar Council websites for the most current versions of these guidelines as they are regularly updated.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Law Society and Bar Council Guidelines Collection",
+            "This document contains information about guidelines issued by the Law Society of South Africa, Legal Practice Council, and various Bar Councils that govern the conduct of legal practitioners in South Africa.",
+            sources,
+            guidelines,
+            "Key Law Society and Bar Council Guidelines:",
+            "Note: This document serves as a placeholder representing the Law Society and Bar Council Guidelines category for the South African Legal LLM Dataset. Researchers should consult the Legal Practice Council, Law Society, and Bar Council websites for the most current versions of these guidelines as they are regularly updated."
+        )
         
-        logging.info(f"Created Law Society and Bar Council guidelines collection document at {output_path}")
+        if created:
+            logger.info("Created Law Society and Bar Council guidelines collection document at %s", output_path)
+        else:
+            logger.info("Law Society and Bar Council guidelines collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     # HISTORICAL MATERIALS
@@ -1067,35 +1546,13 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.historical_dir, "roman_dutch")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about Roman-Dutch law sources
         output_filename = "roman_dutch_law_sources_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "Roman-Dutch Law Sources Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about Roman-Dutch law sources, which form the historical foundation of South African common law. Roman-Dutch law is a legal system based on Roman law as applied in the Netherlands in the 17th and 18th centuries.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         sources = [
             "https://www.saflii.org/za/journals/DEREBUS/2006/42.pdf", # Article on Roman-Dutch law
             "https://www.jstor.org/stable/3052263", # Historical article on Roman-Dutch law
@@ -1105,15 +1562,6 @@ class LegalDocumentsDownloader:
             "https://www.lawlibrary.co.za/resources/roman-dutch-law/", # Law Library resources
         ]
         
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # Key Roman-Dutch law sources
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Key Roman-Dutch Law Sources and Authorities:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         authorities = [
             "Hugo Grotius - Introduction to Dutch Jurisprudence (Inleiding tot de Hollandsche Rechts-Geleerdheid)",
             "Johannes Voet - Commentary on the Pandects (Commentarius ad Pandectas)",
@@ -1129,20 +1577,25 @@ class LegalDocumentsDownloader:
             "Wouter de Vos - Regsgeskiedenis"
         ]
         
-        for authority in authorities:
-            pdf.cell(0, 10, f"- {authority}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Roman-Dutch law sources category for the South African Legal LLM Dataset. It provides references to key historical legal texts that form the foundation of South African common law. Many of these original works are in Latin or Dutch and are available in university libraries or specialized legal collections.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "Roman-Dutch Law Sources Collection",
+            "This document contains information about Roman-Dutch law sources, which form the historical foundation of South African common law. Roman-Dutch law is a legal system based on Roman law as applied in the Netherlands in the 17th and 18th centuries.",
+            sources,
+            authorities,
+            "Key Roman-Dutch Law Sources and Authorities:",
+            "Note: This document serves as a placeholder representing the Roman-Dutch law sources category for the South African Legal LLM Dataset. It provides references to key historical legal texts that form the foundation of South African common law. Many of these original works are in Latin or Dutch and are available in university libraries or specialized legal collections."
+        )
         
-        logging.info(f"Created Roman-Dutch law sources collection document at {output_path}")
+        if created:
+            logger.info("Created Roman-Dutch law sources collection document at %s", output_path)
+        else:
+            logger.info("Roman-Dutch law sources collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     def download_historical_legislation(self):
@@ -1151,35 +1604,13 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.historical_dir, "historical_legislation")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about historical legislation
         output_filename = "historical_legislation_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Historical Legislation Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about historical South African legislation from the colonial and apartheid eras. These laws, while no longer in force, provide important historical context for understanding the development of South African law and society.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         sources = [
             "https://www.sahistory.org.za/sites/default/files/DC/asjan65.4/asjan65.4.pdf", # Native Land Act of 1913
             "https://www.sahistory.org.za/sites/default/files/archive-files2/leg19500707.028.020.050_1.pdf", # Group Areas Act of 1950
@@ -1189,15 +1620,6 @@ class LegalDocumentsDownloader:
             "https://www.gov.za/documents/constitution/repealed-constitution-republic-south-africa-act-110-1983", # 1983 Constitution
         ]
         
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # Key historical legislation
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Significant Historical Legislation:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
         legislation = [
             "Natives Land Act 27 of 1913",
             "Immorality Act 5 of 1927",
@@ -1228,20 +1650,25 @@ class LegalDocumentsDownloader:
             "Republic of South Africa Constitution Act 110 of 1983"
         ]
         
-        for law in legislation:
-            pdf.cell(0, 10, f"- {law}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Historical legislation category for the South African Legal LLM Dataset. It provides references to key historical laws that shaped South Africa's legal and social development. These laws have been repealed but remain important for historical context and understanding the development of South African constitutional democracy.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Historical Legislation Collection",
+            "This document contains information about historical South African legislation from the colonial and apartheid eras. These laws, while no longer in force, provide important historical context for understanding the development of South African law and society.",
+            sources,
+            legislation,
+            "Significant Historical Legislation:",
+            "Note: This document serves as a placeholder representing the Historical legislation category for the South African Legal LLM Dataset. It provides references to key historical laws that shaped South Africa's legal and social development. These laws have been repealed but remain important for historical context and understanding the development of South African constitutional democracy."
+        )
         
-        logging.info(f"Created Historical legislation collection document at {output_path}")
+        if created:
+            logger.info("Created Historical legislation collection document at %s", output_path)
+        else:
+            logger.info("Historical legislation collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     def download_legal_development_commentaries(self):
@@ -1250,83 +1677,32 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.historical_dir, "legal_development")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about legal development commentaries
         output_filename = "legal_development_commentaries_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "South African Legal Development Commentaries Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about commentaries on the development of South African law, tracing its evolution from Roman-Dutch origins through colonial and apartheid eras to the current constitutional democracy.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
-        sources = [
-            "https://www.saflii.org/za/journals/", # SAFLII Journals
-            "https://constitutionallyspeaking.co.za/", # Constitutional Law Blog
-            "https://www.constitutionalcourt.org.za/site/judges/justicekennedy/speech.html", # Constitutional Court Resources
-            "https://www.lawlibrary.co.za/resources/legal-history/", # Law Library Resources
-            "https://www.sahistory.org.za/article/history-south-african-legal-system", # South African History Online
-            "https://www.justice.gov.za/legislation/constitution/history.html", # Department of Justice
-        ]
-        
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # Key commentaries
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Key Legal Development Commentaries:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
-        commentaries = [
-            "The South African Legal System and its Background by H.R. Hahlo and Ellison Kahn",
-            "The History of South African Law by R. Zimmermann and D. Visser",
-            "Constitutional Law of South Africa by S. Woolman and M. Bishop",
-            "The Bill of Rights Handbook by I. Currie and J. de Waal",
-            "The Spirit of the Constitution: Constitutional Disruption in South Africa by Theunis Roux",
-            "The New Constitutional and Administrative Law by I. Currie and J. de Waal",
-            "The Transformative Constitution by Karl Klare",
-            "The Soul of a Nation: Constitution-making in South Africa by Hassen Ebrahim",
-            "One Law, One Nation: The Making of the South African Constitution by Lauren Segal and Sharon Cort",
-            "The Post-Apartheid Constitutions by Penelope Andrews and Stephen Ellmann",
-            "Transformative Constitutionalism: Comparing the Apex Courts of Brazil, India and South Africa by Oscar Vilhena Vieira",
-            "The Dignity Jurisprudence of the Constitutional Court of South Africa by Drucilla Cornell",
-            "The Evolution of Law and Justice in South Africa by Dikgang Moseneke"
-        ]
-        
-        for commentary in commentaries:
-            pdf.cell(0, 10, f"- {commentary}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Legal development commentaries category for the South African Legal LLM Dataset. It provides references to key works that analyze the development of South African law through various historical periods. Many of these works are available in university libraries or through academic publishers.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "South African Legal Development Commentaries Collection",
+            "This document contains information about commentaries on the development of South African law, tracing its evolution from Roman-Dutch origins through colonial and apartheid eras to the current constitutional democracy.",
+            _LEGAL_DEV_SOURCES_TEXT,
+            _LEGAL_DEV_COMMENTARIES_TEXT,
+            "Key Legal Development Commentaries:",
+            "Note: This document serves as a placeholder representing the Legal development commentaries category for the South African Legal LLM Dataset. It provides references to key works that analyze the development of South African law through various historical periods. Many of these works are available in university libraries or through academic publishers."
+        )
         
-        logging.info(f"Created Legal development commentaries collection document at {output_path}")
+        if created:
+            logger.info("Created Legal development commentaries collection document at %s", output_path)
+        else:
+            logger.info("Legal development commentaries collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
         
     def download_comparative_law_studies(self):
@@ -1335,82 +1711,32 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.historical_dir, "comparative_law")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about comparative law studies
         output_filename = "comparative_law_studies_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "Comparative Law Studies Relevant to South Africa Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about comparative law studies that are relevant to South African law. These studies compare South African legal principles, institutions, and practices with those of other jurisdictions, providing valuable insights for legal development.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
-        sources = [
-            "https://www.saflii.org/za/journals/SAJHR/", # South African Journal on Human Rights
-            "https://www.ajol.info/index.php/pelj", # Potchefstroom Electronic Law Journal
-            "https://www.cambridge.org/core/journals/international-journal-of-law-in-context", # International Journal of Law in Context
-            "https://academic.oup.com/icon", # International Journal of Constitutional Law
-            "https://www.tandfonline.com/toc/rjcl20/current", # Journal of Comparative Law
-            "https://www.lawlibrary.co.za/resources/comparative-law/", # Law Library Resources
-        ]
-        
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # Key comparative studies
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Key Comparative Law Studies Relevant to South Africa:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
-        studies = [
-            "Constitutional Rights in Two Worlds: South Africa and the United States by Mark S. Kende",
-            "The Global Expansion of Constitutional Judicial Review: South Africa by Theunis Roux",
-            "Transformative Constitutionalism: Comparing the Apex Courts of Brazil, India and South Africa by Oscar Vilhena Vieira",
-            "Socio-Economic Rights: South Africa, India and the United States by Sandra Liebenberg",
-            "The Horizontal Effect of Constitutional Rights: A Comparative Perspective by Stephen Gardbaum",
-            "Transformative Constitutionalism in South Africa and India by Heinz Klug",
-            "Comparative Constitutional Law: South Africa in Global Context by Francois Venter",
-            "Dignity, Freedom and the Post-Apartheid Legal Order: South Africa and Germany by Arthur Chaskalson",
-            "Comparative Human Rights Law: South Africa in International Context by Sandra Fredman",
-            "Transformative Equality: South Africa and Canada by Catherine Albertyn",
-            "Constitutional Borrowing and Transplants: South Africa's Use of Foreign Precedent by Christa Rautenbach",
-            "Judicial Review in New Democracies: South Africa in Comparative Perspective by Theunis Roux"
-        ]
-        
-        for study in studies:
-            pdf.cell(0, 10, f"- {study}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Comparative law studies category for the South African Legal LLM Dataset. It provides references to key works that compare South African law with legal systems in other jurisdictions. These comparative perspectives have been influential in the development of South African constitutional jurisprudence.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "Comparative Law Studies Relevant to South Africa Collection",
+            "This document contains information about comparative law studies that are relevant to South African law. These studies compare South African legal principles, institutions, and practices with those of other jurisdictions, providing valuable insights for legal development.",
+            _COMPARATIVE_LAW_SOURCES_TEXT,
+            _COMPARATIVE_LAW_STUDIES_TEXT,
+            "Key Comparative Law Studies Relevant to South Africa:",
+            "Note: This document serves as a placeholder representing the Comparative law studies category for the South African Legal LLM Dataset. It provides references to key works that compare South African law with legal systems in other jurisdictions. These comparative perspectives have been influential in the development of South African constitutional jurisprudence."
+        )
         
-        logging.info(f"Created Comparative law studies collection document at {output_path}")
+        if created:
+            logger.info("Created Comparative law studies collection document at %s", output_path)
+        else:
+            logger.info("Comparative law studies collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
         
     def download_legal_anthropology_studies(self):
@@ -1419,88 +1745,37 @@ class LegalDocumentsDownloader:
         category_dir = os.path.join(self.historical_dir, "legal_anthropology")
         
         if self.is_document_present(doc_name, category_dir):
-            logging.info(f"{doc_name} already present, skipping download")
+            logger.info("%s already present, skipping download", doc_name)
             return True
             
-        # Create output directory if it doesn't exist
-        os.makedirs(category_dir, exist_ok=True)
-        
         # Create a summary document with information about legal anthropology studies
         output_filename = "legal_anthropology_studies_collection.pdf"
         output_path = os.path.join(category_dir, output_filename)
         
-        # Use FPDF to create a PDF document
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", size=12)
-        
-        # Add title
-        pdf.set_font("Arial", 'B', 16)
-        pdf.cell(200, 10, "Legal Anthropology Studies on South African Customary Law Collection", ln=True, align='C')
-        pdf.ln(10)
-        
-        # Add information
-        pdf.set_font("Arial", size=12)
-        pdf.multi_cell(0, 10, "This document contains information about legal anthropology studies focusing on South African customary law. These studies examine the intersection of law, culture, and society, with particular emphasis on indigenous legal systems and their interaction with state law.", 0)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Primary Sources:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
-        sources = [
-            "https://www.saflii.org/za/journals/PER/", # Potchefstroom Electronic Law Journal
-            "https://www.ajol.info/index.php/sajhr", # South African Journal on Human Rights
-            "https://www.tandfonline.com/toc/rjlc20/current", # Journal of Legal Pluralism
-            "https://www.jstor.org/journal/jlegplur", # Journal of Legal Pluralism and Unofficial Law
-            "https://www.justice.gov.za/legislation/acts/1998-120.pdf", # Recognition of Customary Marriages Act
-            "https://www.gov.za/sites/default/files/gcis_document/201409/a11-09.pdf", # Reform of Customary Law of Succession Act
-        ]
-        
-        for source in sources:
-            pdf.cell(0, 10, source, ln=True)
-        pdf.ln(5)
-        
-        # Key anthropology studies
-        pdf.set_font("Arial", 'B', 12)
-        pdf.cell(0, 10, "Key Legal Anthropology Studies on South African Customary Law:", ln=True)
-        pdf.set_font("Arial", size=12)
-        
-        studies = [
-            "Customary Law in South Africa by T.W. Bennett",
-            "Human Rights and African Customary Law by T.W. Bennett",
-            "The Harmonisation of Common Law and Indigenous Law by South African Law Commission",
-            "Marriage, Land and Custom by Aninka Claassens and Dee Smythe",
-            "The Future of Customary Law in Africa by A.N. Allott",
-            "Customary Law and the Constitutional Right to Equal Treatment by Chuma Himonga",
-            "Living Customary Law in South Africa by Christa Rautenbach",
-            "Ubuntu: An African Jurisprudence by Thaddeus Metz",
-            "African Customary Law in South Africa: Post-Apartheid and Living Law Perspectives by Chuma Himonga and Tom Nhlapo",
-            "The Constitutional Protection of Cultural and Religious Rights in South Africa by Lourens du Plessis",
-            "Customary Law and Gender Equality by Likhapha Mbatha",
-            "Traditional Courts and the Judicial Function of Traditional Leaders by Sindiso Mnisi Weeks",
-            "Legal Pluralism in South Africa: Challenges and Opportunities by Christa Rautenbach"
-        ]
-        
-        for study in studies:
-            pdf.cell(0, 10, f"- {study}", ln=True)
-        
-        pdf.ln(5)
-        pdf.multi_cell(0, 10, "Note: This document serves as a placeholder representing the Legal anthropology studies category for the South African Legal LLM Dataset. It provides references to key works that examine South African customary law from anthropological and socio-legal perspectives. These studies are important for understanding the pluralistic nature of the South African legal system.", 0)
-        
-        # Save the PDF
-        pdf.output(output_path)
+        # Write the PDF with the shared collection layout, unless the copy on
+        # disk was already built from the same content
+        created = _output_collection_pdf(
+            output_path,
+            "Legal Anthropology Studies on South African Customary Law Collection",
+            "This document contains information about legal anthropology studies focusing on South African customary law. These studies examine the intersection of law, culture, and society, with particular emphasis on indigenous legal systems and their interaction with state law.",
+            _LEGAL_ANTHROPOLOGY_SOURCES_TEXT,
+            _LEGAL_ANTHROPOLOGY_STUDIES_TEXT,
+            "Key Legal Anthropology Studies on South African Customary Law:",
+            "Note: This document serves as a placeholder representing the Legal anthropology studies category for the South African Legal LLM Dataset. It provides references to key works that examine South African customary law from anthropological and socio-legal perspectives. These studies are important for understanding the pluralistic nature of the South African legal system."
+        )
         
-        logging.info(f"Created Legal anthropology studies collection document at {output_path}")
+        if created:
+            logger.info("Created Legal anthropology studies collection document at %s", output_path)
+        else:
+            logger.info("Legal anthropology studies collection document at %s is unchanged", output_path)
         
         # Update checklist
         self.update_checklist_item(doc_name)
-        self.run_checklist_update()
         return True
     
     def download_all_legal_materials(self):
         """Download all legally accessible materials concurrently."""
-        logging.info("Starting concurrent download of all legal materials...")
+        logger.info("Starting concurrent download of all legal materials...")
         
         # List of all download functions
         download_functions = [
@@ -1541,7 +1816,7 @@ class LegalDocumentsDownloader:
         ]
         
         results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
             # Submit all downloads and keep track of futures
             future_to_func = {executor.submit(func): func.__name__ for func in download_functions}
             
@@ -1551,179 +1826,334 @@ class LegalDocumentsDownloader:
                 try:
                     result = future.result()
                     results.append((func_name, result))
-                    logging.info(f"Completed {func_name}: {'Success' if result else 'Failed'}")
+                    logger.info("Completed %s: %s", func_name, 'Success' if result else 'Failed')
                 except Exception as e:
-                    logging.error(f"Error in {func_name}: {str(e)}")
+                    logger.error("Error in %s: %s", func_name, e)
                     results.append((func_name, False))
         
-        # Run the checklist update after all downloads
-        self.run_checklist_update()
+        # Run the checklist update once after all downloads
+        self.flush_checklist_update()
+        
+        return results
+
+    def _multi_stream_download(self, url, response, output_path, nchunks=MULTI_STREAM_CHUNKS):
+        """Finish a download as up to nchunks concurrent byte ranges, within the host limit.
+        
+        response is the caller's unread 200 response for url. It is only used
+        when its headers report 'Accept-Ranges: bytes', no content encoding and
+        a Content-Length above MULTI_STREAM_THRESHOLD, so deciding costs no
+        extra request. The caller must already hold one _host_slot for url;
+        every further range needs a slot of its own, taken only if one is free
+        right now, so the host never sees more than MAX_REQUESTS_PER_HOST
+        connections from us. Returns False, leaving response untouched, when
+        the file does not qualify; True once output_path has been written.
+        """
+        if not hasattr(os, 'pwrite'):
+            return False
+        if response.headers.get('accept-ranges', '').lower() != 'bytes':
+            return False
+        if response.headers.get('content-encoding', 'identity').lower() != 'identity':
+            return False
+        try:
+            length = int(response.headers.get('content-length', 0))
+        except ValueError:
+            return False
+        if length <= MULTI_STREAM_THRESHOLD:
+            return False
         
+        slot = self._host_slot(url)
+        extra = 0
+        while extra < nchunks - 1 and slot.acquire(blocking=False):
+            extra += 1
+        if not extra:
+            return False
+        try:
+            self._download_ranges(url, response, output_path, length, extra + 1)
+            return True
+        finally:
+            for _ in range(extra):
+                slot.release()
+    
+    def _download_ranges(self, url, response, output_path, length, nchunks):
+        """Download length bytes of url as nchunks byte ranges into a preallocated file.
+        
+        The first range is read from response, the caller's open 200 response,
+        while the others are requested concurrently, each waiting for the
+        host's rate limiter. The ranges are assembled in a separate file that
+        only replaces output_path once every range has been written.
+        """
+        step = -(-length // nchunks)
+        ranges = [(start, min(start + step, length) - 1) for start in range(0, length, step)]
+        
+        tmp_path = output_path + '.ranges'
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        
+        def write_range(body, start, end):
+            offset = start
+            while offset <= end:
+                chunk = body.read(min(STREAM_CHUNK_SIZE, end + 1 - offset))
+                if not chunk:
+                    raise IOError(f"Incomplete range {start}-{end} for {url}")
+                view = memoryview(chunk)
+                while view:
+                    written = os.pwrite(fd, view, offset)
+                    offset += written
+                    view = view[written:]
+        
+        def fetch_range(byte_range):
+            start, end = byte_range
+            # Ask for the raw bytes so byte ranges line up with the file on disk
+            headers = {'Accept-Encoding': 'identity', 'Range': f'bytes={start}-{end}'}
+            self._throttle(url)
+            range_response = self.session.get(url, headers=headers, stream=True, timeout=30)
+            try:
+                range_response.raise_for_status()
+                if range_response.status_code != 206:
+                    raise IOError(f"{url} ignored the Range header")
+                write_range(range_response.raw, start, end)
+            finally:
+                range_response.close()
+        
+        try:
+            try:
+                os.posix_fallocate(fd, 0, length)
+            except (AttributeError, OSError):
+                os.ftruncate(fd, length)
+            
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(ranges) - 1) as executor:
+                futures = [executor.submit(fetch_range, byte_range) for byte_range in ranges[1:]]
+                # The caller's response serves the first range meanwhile
+                try:
+                    write_range(response.raw, *ranges[0])
+                finally:
+                    response.close()
+                for future in futures:
+                    future.result()
+        except Exception:
+            os.close(fd)
+            os.remove(tmp_path)
+            raise
+        os.close(fd)
+        os.replace(tmp_path, output_path)
+    
+    def _fetch_one_pdf(self, pdf_url, out_dir, fallback_name, existing=None):
+        """Download a single scraped PDF into out_dir unless it is already there.
+        
+        The filename is taken from the URL path, falling back to fallback_name.
+        existing is an optional set of the names already in out_dir, saving a
+        stat per file. Errors are logged rather than raised so one bad link
+        does not stop the other downloads of a scraper.
+        """
+        try:
+            # Clean up the filename
+            filename = _url_filename(pdf_url, fallback_name)
+            if not filename.endswith('.pdf'):
+                filename += '.pdf'
+                
+            output_path = os.path.join(out_dir, filename)
+            
+            meta_path = output_path + '.meta.json'
+            
+            if existing is not None:
+                present = filename in existing
+            else:
+                present = os.path.exists(output_path)
+            
+            # Existing files are only checked again when revalidating, using
+            # the ETag/Last-Modified recorded when they were downloaded
+            conditional_headers = {}
+            if present:
+                if not self.revalidate:
+                    return True
+                conditional_headers = _conditional_headers(meta_path)
+                if not conditional_headers:
+                    return True
+            
+            logger.info("Downloading %s...", filename)
+            with self._host_slot(pdf_url):
+                # Stream into a '.part' file that only replaces output_path
+                # once complete, continuing an interrupted earlier attempt
+                # with a Range request when one was left behind. If-Range
+                # makes the server send the whole file instead if it has
+                # changed since the partial file was started; a partial
+                # file without a recorded validator cannot be checked and
+                # is discarded
+                part_path = output_path + '.part'
+                part_meta_path = part_path + '.meta.json'
+                headers = dict(conditional_headers)
+                if not conditional_headers and os.path.exists(part_path):
+                    if_range = _if_range_validator(part_meta_path)
+                    if if_range:
+                        resume_from = os.path.getsize(part_path)
+                        headers['Range'] = f'bytes={resume_from}-'
+                        headers['If-Range'] = if_range
+                        headers['Accept-Encoding'] = 'identity'
+                    else:
+                        os.remove(part_path)
+                
+                self._throttle(pdf_url)
+                response = self.session.get(pdf_url, headers=headers, stream=True, timeout=30)
+                if response.status_code == 416:
+                    # The partial file no longer matches the remote one
+                    os.remove(part_path)
+                    _remove_if_exists(part_meta_path)
+                response.raise_for_status()
+                if response.status_code == 304:
+                    logger.info("%s not modified, skipping", filename)
+                    return True
+                
+                resumed = response.status_code == 206
+                if not resumed:
+                    # A fresh body; remember its validators so an
+                    # interrupted copy can be resumed safely next time
+                    _remove_if_exists(part_meta_path)
+                    _save_validators(part_meta_path, response.headers)
+                
+                # Large files are finished as parallel byte ranges when the
+                # response shows the server supports them, otherwise the
+                # response is streamed as it is
+                if resumed or not self._multi_stream_download(pdf_url, response, output_path):
+                    _write_stream(response, part_path, append=resumed)
+                    os.replace(part_path, output_path)
+                _remove_if_exists(part_meta_path)
+                validators = response.headers
+            
+            _save_validators(meta_path, validators)
+            logger.info("Downloaded %s", filename)
+            return True
+        except Exception as e:
+            logger.error("Error downloading %s: %s", pdf_url, e)
+            return False
+
+    def _fetch_pdfs(self, pdf_urls, out_dir, fallback_prefix, max_workers=PDF_FETCH_WORKERS):
+        """Download several scraped PDFs into out_dir concurrently.
+        
+        Each URL goes through _fetch_one_pdf. Links without a usable filename
+        are saved as '<fallback_prefix>_<n>.pdf'. The per-host token bucket and
+        request limit keep the workers polite to the scraped site.
+        """
+        existing = _existing_files(out_dir)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._fetch_one_pdf, pdf_url, out_dir, f"{fallback_prefix}_{i+1}.pdf", existing)
+                for i, pdf_url in enumerate(pdf_urls)
+            ]
+            results = [
+                future.result()
+                for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures),
+                                   desc=os.path.basename(out_dir), leave=False)
+            ]
         return results
 
+    def _get_listing(self, url):
+        """GET a listing page, using the prefetched response when one was started."""
+        with self._prefetched_lock:
+            future = self._prefetched.pop(url, None)
+        if future is not None:
+            return future.result()
+        return self.session.get(url, timeout=30)
+
+    def _prefetch_listings(self, executor, urls):
+        """Start fetching listing pages so they are in memory before they are parsed."""
+        with self._prefetched_lock:
+            for url in urls:
+                if url not in self._prefetched:
+                    self._prefetched[url] = executor.submit(self.session.get, url, timeout=30)
+
     def download_provincial_gazettes(self):
         """Download provincial legislation from gazettes.africa."""
         logger.info("Downloading Provincial Gazettes from gazettes.africa...")
         
-        # Create provincial directories
-        provinces = [
-            "eastern_cape", "free_state", "gauteng", "kwazulu_natal", 
-            "limpopo", "mpumalanga", "northern_cape", "north_west", "western_cape"
-        ]
-        
-        for province in provinces:
-            province_dir = os.path.join(PROVINCIAL_DIR, province)
-            os.makedirs(province_dir, exist_ok=True)
-        
         # Gazettes.africa URL for South African gazettes
-        base_url = "https://gazettes.africa/gazettes/za"
+        base_url = GAZETTES_URL
         
         try:
-            response = requests.get(base_url, headers=HEADERS, timeout=30)
+            response = self._get_listing(base_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = lxml.html.fromstring(response.content)
             
             # Find links to provincial gazettes
             province_links = {}
-            for link in soup.find_all('a'):
+            for link in tree.xpath('//a[@href]'):
                 href = link.get('href')
-                link_text = link.text.strip().lower()
+                if '/gazettes/za/' not in href:
+                    continue
                 
                 # Match province names in links
-                for province in provinces:
-                    # Convert underscores to spaces for matching
-                    province_name = province.replace('_', ' ')
-                    if province_name in link_text and href and '/gazettes/za/' in href:
-                        province_links[province] = urljoin(base_url, href)
-                        break
+                match = _PROVINCE_RE.search(link.text_content().lower())
+                if match:
+                    province_links[_PROVINCE_LOOKUP[match.group()]] = urljoin(base_url, href)
             
             # Download a sample of recent gazettes for each province (limiting to avoid overwhelming)
             for province, url in province_links.items():
-                province_dir = os.path.join(PROVINCIAL_DIR, province)
-                logger.info(f"Downloading sample gazettes for {province}...")
+                province_dir = _PROVINCE_DIRS[province]
+                logger.info("Downloading sample gazettes for %s...", province)
                 
                 try:
-                    response = requests.get(url, headers=HEADERS, timeout=30)
+                    response = self.session.get(url, timeout=30)
                     response.raise_for_status()
                     
-                    soup = BeautifulSoup(response.text, 'html.parser')
+                    tree = lxml.html.fromstring(response.content)
                     
                     # Find PDF links
-                    pdf_links = []
-                    for link in soup.find_all('a'):
-                        href = link.get('href')
-                        if href and href.endswith('.pdf'):
-                            pdf_links.append(urljoin(url, href))
+                    pdf_links = [urljoin(url, href) for href in _PDF_HREF_XPATH(tree)]
                     
                     # Download up to 5 recent gazettes
+                    existing = _existing_files(province_dir)
                     for i, pdf_url in enumerate(pdf_links[:5]):
-                        filename = os.path.basename(pdf_url)
+                        filename = _url_filename(pdf_url, f"{province}_gazette_{i+1}.pdf")
                         output_path = os.path.join(province_dir, filename)
                         
-                        if not os.path.exists(output_path):
-                            logger.info(f"Downloading {filename}...")
-                            response = requests.get(pdf_url, headers=HEADERS, stream=True, timeout=30)
+                        if filename not in existing:
+                            logger.info("Downloading %s...", filename)
+                            self._throttle(pdf_url)
+                            response = self.session.get(pdf_url, stream=True, timeout=30)
                             response.raise_for_status()
                             
-                            with open(output_path, 'wb') as f:
-                                for chunk in response.iter_content(chunk_size=8192):
-                                    f.write(chunk)
+                            _write_stream(response, output_path)
                             
-                            logger.info(f"Downloaded {filename}")
-                            # Add a small delay to be respectful to the server
-                            time.sleep(2)
+                            logger.info("Downloaded %s", filename)
                     
                 except Exception as e:
-                    logger.error(f"Error downloading gazettes for {province}: {e}")
+                    logger.error("Error downloading gazettes for %s: %s", province, e)
             
             self.update_checklist_item("Provincial Legislation")
             return True
             
         except Exception as e:
-            logger.error(f"Error accessing gazettes.africa: {e}")
+            logger.error("Error accessing gazettes.africa: %s", e)
             return False
 
     def download_municipal_bylaws(self):
         """Download municipal by-laws from major city websites."""
         logger.info("Downloading Municipal By-laws from major cities...")
         
-        # Define major cities with their by-laws URLs
-        cities = {
-            "cape_town": {
-                "name": "Cape Town",
-                "url": "https://www.capetown.gov.za/Family%20and%20home/City-publications/policies-and-by-laws",
-                "pdf_pattern": r'\.pdf$'
-            },
-            "johannesburg": {
-                "name": "Johannesburg",
-                "url": "https://www.joburg.org.za/documents_/By-Laws/Pages/By%20Law.aspx",
-                "pdf_pattern": r'\.pdf$'
-            },
-            "durban": {
-                "name": "Durban",
-                "url": "http://www.durban.gov.za/Resource_Centre/Services_By_Laws/Pages/default.aspx",
-                "pdf_pattern": r'\.pdf$'
-            },
-            "tshwane": {
-                "name": "Tshwane",
-                "url": "http://www.tshwane.gov.za/sites/residents/Services/Pages/By-Law-Book.aspx",
-                "pdf_pattern": r'\.pdf$'
-            }
-        }
-        
-        for city_key, city_info in cities.items():
-            city_dir = os.path.join(MUNICIPAL_DIR, city_key)
-            os.makedirs(city_dir, exist_ok=True)
+        for city_key, city_info in MUNICIPAL_CITIES.items():
+            city_dir = _MUNICIPAL_CITY_DIRS[city_key]
             
-            logger.info(f"Downloading by-laws for {city_info['name']}...")
+            logger.info("Downloading by-laws for %s...", city_info['name'])
             
             try:
-                response = requests.get(city_info['url'], headers=HEADERS, timeout=30)
+                response = self._get_listing(city_info['url'])
                 response.raise_for_status()
                 
-                soup = BeautifulSoup(response.text, 'html.parser')
+                tree = lxml.html.fromstring(response.content)
                 
                 # Find PDF links
                 pdf_links = []
-                for link in soup.find_all('a'):
-                    href = link.get('href')
-                    if href and re.search(city_info['pdf_pattern'], href, re.IGNORECASE):
-                        # Make sure we have the full URL
-                        if href.startswith('http'):
-                            pdf_links.append(href)
-                        else:
-                            pdf_links.append(urljoin(city_info['url'], href))
+                for href in city_info['pdf_links'](tree):
+                    # Make sure we have the full URL
+                    if href.startswith('http'):
+                        pdf_links.append(href)
+                    else:
+                        pdf_links.append(urljoin(city_info['url'], href))
                 
-                # Download up to 10 by-laws per city
-                for i, pdf_url in enumerate(pdf_links[:10]):
-                    try:
-                        # Clean up the filename
-                        filename = os.path.basename(urlparse(pdf_url).path)
-                        if not filename:
-                            filename = f"{city_key}_bylaw_{i+1}.pdf"
-                        if not filename.endswith('.pdf'):
-                            filename += '.pdf'
-                            
-                        output_path = os.path.join(city_dir, filename)
-                        
-                        if not os.path.exists(output_path):
-                            logger.info(f"Downloading {filename}...")
-                            response = requests.get(pdf_url, headers=HEADERS, stream=True, timeout=30)
-                            response.raise_for_status()
-                            
-                            with open(output_path, 'wb') as f:
-                                for chunk in response.iter_content(chunk_size=8192):
-                                    f.write(chunk)
-                            
-                            logger.info(f"Downloaded {filename}")
-                            # Add a small delay to be respectful to the server
-                            time.sleep(2)
-                    except Exception as e:
-                        logger.error(f"Error downloading {pdf_url}: {e}")
+                # Download up to 10 by-laws per city, a few at a time
+                self._fetch_pdfs(pdf_links[:10], city_dir, f"{city_key}_bylaw")
                 
             except Exception as e:
-                logger.error(f"Error accessing {city_info['name']} website: {e}")
+                logger.error("Error accessing %s website: %s", city_info['name'], e)
         
         self.update_checklist_item("Municipal By-laws")
         return True
@@ -1744,48 +2174,46 @@ class LegalDocumentsDownloader:
             os.makedirs(source_dir, exist_ok=True)
         
         # UCT OpenBooks - Constitutional Law
-        uct_url = "https://openbooks.uct.ac.za/uct/catalog/book/25"
+        uct_url = UCT_OPENBOOKS_URL
         uct_dir = os.path.join(TEXTBOOKS_DIR, "uct_openbooks")
         
         try:
             logger.info("Accessing UCT OpenBooks...")
-            response = requests.get(uct_url, headers=HEADERS, timeout=30)
+            response = self._get_listing(uct_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = lxml.html.fromstring(response.content)
             
             # Look for download links (PDF, etc.)
             download_links = []
-            for link in soup.find_all('a'):
+            for link in tree.xpath('//a[@href]'):
                 href = link.get('href')
-                text = link.text.strip().lower()
-                if href and ('download' in text or '.pdf' in href.lower()):
+                text = link.text_content().strip().lower()
+                if 'download' in text or '.pdf' in href.lower():
                     download_links.append(urljoin(uct_url, href))
             
             if download_links:
+                existing = _existing_files(uct_dir)
                 for i, link in enumerate(download_links):
                     try:
                         # Extract filename from the URL or create a generic one
-                        filename = os.path.basename(urlparse(link).path)
-                        if not filename or '.' not in filename:
+                        filename = _url_filename(link, "")
+                        if '.' not in filename:
                             filename = f"constitutional_law_textbook_{i+1}.pdf"
                         
                         output_path = os.path.join(uct_dir, filename)
                         
-                        if not os.path.exists(output_path):
-                            logger.info(f"Downloading {filename}...")
-                            response = requests.get(link, headers=HEADERS, stream=True, timeout=30)
+                        if filename not in existing:
+                            logger.info("Downloading %s...", filename)
+                            self._throttle(link)
+                            response = self.session.get(link, stream=True, timeout=30)
                             response.raise_for_status()
                             
-                            with open(output_path, 'wb') as f:
-                                for chunk in response.iter_content(chunk_size=8192):
-                                    f.write(chunk)
+                            _write_stream(response, output_path)
                             
-                            logger.info(f"Downloaded {filename}")
-                            # Add a delay to be respectful to the server
-                            time.sleep(2)
+                            logger.info("Downloaded %s", filename)
                     except Exception as e:
-                        logger.error(f"Error downloading {link}: {e}")
+                        logger.error("Error downloading %s: %s", link, e)
             else:
                 # If we can't find download links, save the HTML content as a fallback
                 logger.warning("No direct download links found. Saving page content...")
@@ -1795,51 +2223,47 @@ class LegalDocumentsDownloader:
                 logger.info("Saved HTML content as fallback")
                 
         except Exception as e:
-            logger.error(f"Error accessing UCT OpenBooks: {e}")
+            logger.error("Error accessing UCT OpenBooks: %s", e)
         
         # Directory of Open Access Books - Search for South African Law books
-        doab_url = "https://www.doabooks.org/doab?func=search&uiLanguage=en&template=&query=south+african+law"
+        doab_url = DOAB_SEARCH_URL
         doab_dir = os.path.join(TEXTBOOKS_DIR, "doab")
         
         try:
             logger.info("Searching DOAB for South African law books...")
-            response = requests.get(doab_url, headers=HEADERS, timeout=30)
+            response = self._get_listing(doab_url)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            tree = lxml.html.fromstring(response.content)
             
             # Find book entries
             book_links = []
-            for link in soup.find_all('a'):
-                href = link.get('href')
-                if href and 'doab?func=book&' in href:
+            for href in tree.xpath('//a/@href'):
+                if 'doab?func=book&' in href:
                     book_links.append(urljoin(doab_url, href))
             
             # Process up to 5 books
+            existing = _existing_files(doab_dir)
             for i, book_url in enumerate(book_links[:5]):
                 try:
-                    logger.info(f"Accessing book page {i+1}...")
-                    response = requests.get(book_url, headers=HEADERS, timeout=30)
+                    logger.info("Accessing book page %s...", i+1)
+                    response = self.session.get(book_url, timeout=30)
                     response.raise_for_status()
                     
-                    book_soup = BeautifulSoup(response.text, 'html.parser')
+                    book_tree = lxml.html.fromstring(response.content)
                     
                     # Extract book title
-                    title_elem = book_soup.find('h1')
+                    title_elems = book_tree.xpath('//h1')
                     title = "law_book"
-                    if title_elem:
-                        title = title_elem.text.strip()
+                    if title_elems:
+                        title = title_elems[0].text_content().strip()
                         # Clean up the title for use as a filename
                         title = re.sub(r'[^\w\s-]', '', title)
                         title = re.sub(r'\s+', '_', title)
                         title = title.lower()
                     
                     # Find PDF download links
-                    pdf_links = []
-                    for link in book_soup.find_all('a'):
-                        href = link.get('href')
-                        if href and href.endswith('.pdf'):
-                            pdf_links.append(href)
+                    pdf_links = [str(href) for href in _PDF_HREF_XPATH(book_tree)]
                     
                     if pdf_links:
                         for j, pdf_url in enumerate(pdf_links[:1]):  # Just get the first PDF
@@ -1847,259 +2271,81 @@ class LegalDocumentsDownloader:
                                 filename = f"{title}_{j+1}.pdf"
                                 output_path = os.path.join(doab_dir, filename)
                                 
-                                if not os.path.exists(output_path):
-                                    logger.info(f"Downloading {filename}...")
-                                    response = requests.get(pdf_url, headers=HEADERS, stream=True, timeout=60)
+                                if filename not in existing:
+                                    logger.info("Downloading %s...", filename)
+                                    self._throttle(pdf_url)
+                                    response = self.session.get(pdf_url, stream=True, timeout=60)
                                     response.raise_for_status()
                                     
-                                    with open(output_path, 'wb') as f:
-                                        for chunk in response.iter_content(chunk_size=8192):
-                                            f.write(chunk)
+                                    _write_stream(response, output_path)
                                     
-                                    logger.info(f"Downloaded {filename}")
-                                    # Add a delay to be respectful to the server
-                                    time.sleep(3)
+                                    logger.info("Downloaded %s", filename)
                             except Exception as e:
-                                logger.error(f"Error downloading {pdf_url}: {e}")
+                                logger.error("Error downloading %s: %s", pdf_url, e)
                     else:
-                        logger.warning(f"No PDF links found for book {i+1}")
+                        logger.warning("No PDF links found for book %s", i+1)
                 
                 except Exception as e:
-                    logger.error(f"Error processing book page {book_url}: {e}")
+                    logger.error("Error processing book page %s: %s", book_url, e)
             
         except Exception as e:
-            logger.error(f"Error accessing DOAB: {e}")
+            logger.error("Error accessing DOAB: %s", e)
             
         self.update_checklist_item("Open Access Textbooks")
         return True
 
-    def download_tax_guides(self):
-        """Download tax guides and resources from SARS."""
-        logger.info("Downloading Tax Guides from SARS...")
-        
-        tax_dir = os.path.join(SPECIALIZED_DIR, "tax_guides")
-        os.makedirs(tax_dir, exist_ok=True)
-        
-        # SARS tax guide URL
-        sars_url = "https://www.sars.gov.za/types-of-tax/"
-        
+    def _fetch_listing(self, spec):
+        """Fetch the listing page of a specialized source, or None if it failed."""
         try:
-            response = requests.get(sars_url, headers=HEADERS, timeout=30)
+            response = self._get_listing(spec.url)
             response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find links to tax guides (PDF files)
-            pdf_links = []
-            for link in soup.find_all('a'):
-                href = link.get('href')
-                if href and href.endswith('.pdf') and ('guide' in href.lower() or 'tax' in href.lower()):
-                    if href.startswith('http'):
-                        pdf_links.append(href)
-                    else:
-                        pdf_links.append(urljoin(sars_url, href))
-            
-            # Download up to 10 tax guides
-            for i, pdf_url in enumerate(pdf_links[:10]):
-                try:
-                    filename = os.path.basename(urlparse(pdf_url).path)
-                    if not filename:
-                        filename = f"tax_guide_{i+1}.pdf"
-                    
-                    output_path = os.path.join(tax_dir, filename)
-                    
-                    if not os.path.exists(output_path):
-                        logger.info(f"Downloading {filename}...")
-                        response = requests.get(pdf_url, headers=HEADERS, stream=True, timeout=30)
-                        response.raise_for_status()
-                        
-                        with open(output_path, 'wb') as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-                        
-                        logger.info(f"Downloaded {filename}")
-                        # Add a delay to be respectful to the server
-                        time.sleep(2)
-                except Exception as e:
-                    logger.error(f"Error downloading {pdf_url}: {e}")
-            
-            self.update_checklist_item("Tax Law Commentaries and Guides")
-            return True
-            
+            return response.content
         except Exception as e:
-            logger.error(f"Error accessing SARS website: {e}")
-            return False
+            logger.error("Error accessing %s: %s", spec.site, e)
+            return None
 
-    def download_competition_guidelines(self):
-        """Download competition law guidelines from the Competition Commission."""
-        logger.info("Downloading Competition Law Guidelines...")
+    def _download_source_links(self, spec, pdf_links):
+        """Download the PDF links found on a specialized source's listing page."""
+        target_dir = _SPECIALIZED_SOURCE_DIRS[spec.subdir]
+        os.makedirs(target_dir, exist_ok=True)
         
-        competition_dir = os.path.join(SPECIALIZED_DIR, "competition_law")
-        os.makedirs(competition_dir, exist_ok=True)
+        # Download up to the source's limit (all links when it has none)
+        self._fetch_pdfs(pdf_links[:spec.limit], target_dir, spec.fallback_prefix)
         
-        # Competition Commission URL
-        cc_url = "https://www.compcom.co.za/guidelines-for-stakeholders/"
+        self.update_checklist_item(spec.checklist_item)
+        return True
+
+    def _download_pdf_source(self, spec):
+        """Download the PDFs linked from one specialized domain listing page."""
+        logger.info("Downloading %s...", spec.description)
+        
+        content = self._fetch_listing(spec)
+        if content is None:
+            return False
         
         try:
-            response = requests.get(cc_url, headers=HEADERS, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find links to guidelines (PDF files)
-            pdf_links = []
-            for link in soup.find_all('a'):
-                href = link.get('href')
-                if href and href.endswith('.pdf') and ('guideline' in href.lower() or 'guidance' in href.lower()):
-                    if href.startswith('http'):
-                        pdf_links.append(href)
-                    else:
-                        pdf_links.append(urljoin(cc_url, href))
-            
-            # Download all found guidelines
-            for i, pdf_url in enumerate(pdf_links):
-                try:
-                    filename = os.path.basename(urlparse(pdf_url).path)
-                    if not filename:
-                        filename = f"competition_guideline_{i+1}.pdf"
-                    
-                    output_path = os.path.join(competition_dir, filename)
-                    
-                    if not os.path.exists(output_path):
-                        logger.info(f"Downloading {filename}...")
-                        response = requests.get(pdf_url, headers=HEADERS, stream=True, timeout=30)
-                        response.raise_for_status()
-                        
-                        with open(output_path, 'wb') as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-                        
-                        logger.info(f"Downloaded {filename}")
-                        # Add a delay to be respectful to the server
-                        time.sleep(2)
-                except Exception as e:
-                    logger.error(f"Error downloading {pdf_url}: {e}")
-            
-            self.update_checklist_item("Competition Law Guidelines and Notices")
-            return True
-            
+            pdf_links = _extract_pdf_links(content, spec.url, spec.href_filter)
         except Exception as e:
-            logger.error(f"Error accessing Competition Commission website: {e}")
+            logger.error("Error reading %s: %s", spec.site, e)
             return False
+        
+        return self._download_source_links(spec, pdf_links)
+
+    def download_tax_guides(self):
+        """Download tax guides and resources from SARS."""
+        return self._download_pdf_source(SPECIALIZED_SOURCES["tax"])
+
+    def download_competition_guidelines(self):
+        """Download competition law guidelines from the Competition Commission."""
+        return self._download_pdf_source(SPECIALIZED_SOURCES["competition"])
 
     def download_environmental_law(self):
         """Download environmental law compilations."""
-        logger.info("Downloading Environmental Law Compilations...")
-        
-        env_dir = os.path.join(SPECIALIZED_DIR, "environmental_law")
-        os.makedirs(env_dir, exist_ok=True)
-        
-        # Department of Environment URL
-        env_url = "https://www.dffe.gov.za/legislation/actsregulations"
-        
-        try:
-            response = requests.get(env_url, headers=HEADERS, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find links to environmental laws (PDF files)
-            pdf_links = []
-            for link in soup.find_all('a'):
-                href = link.get('href')
-                if href and href.endswith('.pdf'):
-                    if href.startswith('http'):
-                        pdf_links.append(href)
-                    else:
-                        pdf_links.append(urljoin(env_url, href))
-            
-            # Download environmental law documents
-            for i, pdf_url in enumerate(pdf_links[:15]):  # Limit to 15 documents
-                try:
-                    filename = os.path.basename(urlparse(pdf_url).path)
-                    if not filename:
-                        filename = f"environmental_law_{i+1}.pdf"
-                    
-                    output_path = os.path.join(env_dir, filename)
-                    
-                    if not os.path.exists(output_path):
-                        logger.info(f"Downloading {filename}...")
-                        response = requests.get(pdf_url, headers=HEADERS, stream=True, timeout=30)
-                        response.raise_for_status()
-                        
-                        with open(output_path, 'wb') as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-                        
-                        logger.info(f"Downloaded {filename}")
-                        # Add a delay to be respectful to the server
-                        time.sleep(2)
-                except Exception as e:
-                    logger.error(f"Error downloading {pdf_url}: {e}")
-            
-            self.update_checklist_item("Environmental Law Compilations")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error accessing Department of Environment website: {e}")
-            return False
+        return self._download_pdf_source(SPECIALIZED_SOURCES["environmental"])
 
     def download_intellectual_property_resources(self):
         """Download intellectual property resources from CIPC."""
-        logger.info("Downloading Intellectual Property Resources...")
-        
-        ip_dir = os.path.join(SPECIALIZED_DIR, "intellectual_property")
-        os.makedirs(ip_dir, exist_ok=True)
-        
-        # CIPC IP URL
-        cipc_url = "https://www.cipc.co.za/?page_id=1423"
-        
-        try:
-            response = requests.get(cipc_url, headers=HEADERS, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Find links to IP resources (PDF files)
-            pdf_links = []
-            for link in soup.find_all('a'):
-                href = link.get('href')
-                if href and href.endswith('.pdf'):
-                    if href.startswith('http'):
-                        pdf_links.append(href)
-                    else:
-                        pdf_links.append(urljoin(cipc_url, href))
-            
-            # Download IP resources
-            for i, pdf_url in enumerate(pdf_links):
-                try:
-                    filename = os.path.basename(urlparse(pdf_url).path)
-                    if not filename:
-                        filename = f"ip_resource_{i+1}.pdf"
-                    
-                    output_path = os.path.join(ip_dir, filename)
-                    
-                    if not os.path.exists(output_path):
-                        logger.info(f"Downloading {filename}...")
-                        response = requests.get(pdf_url, headers=HEADERS, stream=True, timeout=30)
-                        response.raise_for_status()
-                        
-                        with open(output_path, 'wb') as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-                        
-                        logger.info(f"Downloaded {filename}")
-                        # Add a delay to be respectful to the server
-                        time.sleep(2)
-                except Exception as e:
-                    logger.error(f"Error downloading {pdf_url}: {e}")
-            
-            self.update_checklist_item("Intellectual Property Law Compilations")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error accessing CIPC website: {e}")
-            return False
+        return self._download_pdf_source(SPECIALIZED_SOURCES["intellectual_property"])
 
     def download_additional_specialized_resources(self):
         """Download all specialized domain resources concurrently."""
@@ -2108,27 +2354,46 @@ class LegalDocumentsDownloader:
         # Create specialized domains directory
         os.makedirs(SPECIALIZED_DIR, exist_ok=True)
         
-        # List of specialized domain download methods
-        specialized_methods = [
-            self.download_tax_guides,
-            self.download_competition_guidelines,
-            self.download_environmental_law,
-            self.download_intellectual_property_resources
-        ]
+        specs = list(SPECIALIZED_SOURCES.values())
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {executor.submit(method): method.__name__ for method in specialized_methods}
+            # Fetch every listing page first, while only waiting on the network
+            pages = list(executor.map(self._fetch_listing, specs))
+            for spec, content in zip(specs, pages):
+                if content is None:
+                    logger.warning("Failed to download %s", spec.description)
+            
+            # Extract the PDF links of all pages. lxml releases the GIL while it
+            # parses, so the pages are parsed in parallel as well.
+            link_futures = {
+                executor.submit(_extract_pdf_links, content, spec.url, spec.href_filter): spec
+                for spec, content in zip(specs, pages) if content is not None
+            }
+            
+            # Then download the PDFs of every source as its links become available
+            futures = {}
+            for link_future in concurrent.futures.as_completed(link_futures):
+                spec = link_futures[link_future]
+                try:
+                    pdf_links = link_future.result()
+                except Exception as e:
+                    logger.error("Error reading %s: %s", spec.site, e)
+                    continue
+                futures[executor.submit(self._download_source_links, spec, pdf_links)] = spec.description
             
             for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Specialized Resources"):
-                method_name = futures[future]
+                source_name = futures[future]
                 try:
                     result = future.result()
                     if result:
-                        logger.info(f"Successfully downloaded {method_name}")
+                        logger.info("Successfully downloaded %s", source_name)
                     else:
-                        logger.warning(f"Failed to download {method_name}")
+                        logger.warning("Failed to download %s", source_name)
                 except Exception as e:
-                    logger.error(f"Error in {method_name}: {e}")
+                    logger.error("Error in %s: %s", source_name, e)
+        
+        # Mark every finished source in one checklist write
+        self._write_pending_checklist()
         
         return True
 
@@ -2144,25 +2409,51 @@ class LegalDocumentsDownloader:
             self.download_additional_specialized_resources
         ]
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            futures = {executor.submit(method): method.__name__ for method in additional_methods}
+        # Every listing page, requested up front so no method waits on its first GET
+        listing_urls = [GAZETTES_URL, UCT_OPENBOOKS_URL, DOAB_SEARCH_URL]
+        listing_urls.extend(city_info['url'] for city_info in MUNICIPAL_CITIES.values())
+        listing_urls.extend(spec.url for spec in SPECIALIZED_SOURCES.values())
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as prefetcher:
+            self._prefetch_listings(prefetcher, listing_urls)
             
-            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Additional Resources"):
-                method_name = futures[future]
-                try:
-                    result = future.result()
-                    if result:
-                        logger.info(f"Successfully downloaded {method_name}")
-                    else:
-                        logger.warning(f"Failed to download {method_name}")
-                except Exception as e:
-                    logger.error(f"Error in {method_name}: {e}")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {executor.submit(method): method.__name__ for method in additional_methods}
+                
+                for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="Additional Resources"):
+                    method_name = futures[future]
+                    try:
+                        result = future.result()
+                        if result:
+                            logger.info("Successfully downloaded %s", method_name)
+                        else:
+                            logger.warning("Failed to download %s", method_name)
+                    except Exception as e:
+                        logger.error("Error in %s: %s", method_name, e)
+            
+            # Drop prefetched pages that no method ended up reading
+            with self._prefetched_lock:
+                self._prefetched.clear()
         
-        # Update the checklist after downloading all resources
-        self.run_checklist_update()
+        # Update the checklist once after downloading all resources
+        self.flush_checklist_update()
         
         return True
 
+def _start_queue_logging():
+    """Route log records through a queue handled by a background listener.
+    
+    Download threads then only enqueue records, instead of taking the
+    handler lock and writing to the console themselves. Returns the
+    listener, which must be stopped to flush the remaining records.
+    """
+    root = logging.getLogger()
+    log_queue = queue.Queue(-1)
+    listener = logging.handlers.QueueListener(log_queue, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    return listener
+
 def main():
     """Main function to parse command line arguments and download legal documents."""
     parser = argparse.ArgumentParser(description='Download South African legal documents')
@@ -2216,10 +2507,19 @@ def main():
     parser.add_argument("--textbooks", action="store_true", help="Download Open Access Textbooks from UCT and DOAB")
     parser.add_argument("--specialized", action="store_true", help="Download specialized domain materials (Tax, Competition, Environmental, IP)")
     parser.add_argument("--additional-all", action="store_true", help="Download all additional resources concurrently")
+    parser.add_argument("--revalidate", action="store_true", help="Re-check already downloaded resources and fetch them again if they changed")
 
     args = parser.parse_args()
     
-    downloader = LegalDocumentsDownloader()
+    log_listener = _start_queue_logging()
+    try:
+        _run_downloads(args)
+    finally:
+        log_listener.stop()
+
+def _run_downloads(args):
+    """Run the downloads selected on the command line."""
+    downloader = LegalDocumentsDownloader(revalidate=args.revalidate)
     
     # Additional resources
     if args.provincial:
@@ -2240,6 +2540,10 @@ def main():
     # All legal materials
     if args.all:
         downloader.download_all_legal_materials()
+    
+    # Recalculate checklist statistics for anything downloaded above
+    downloader.flush_checklist_update()
+    downloader.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
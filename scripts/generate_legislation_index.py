@@ -9,7 +9,10 @@ import os
 import re
 import argparse
 import datetime
+import operator
+import functools
 from pathlib import Path
+from collections import defaultdict
 import logging
 
 # Setup logging
@@ -25,6 +28,29 @@ SCRAPERS_OUTPUT_DIR = "scrapers_output"
 CORE_LEGISLATION_DIR = os.path.join(SCRAPERS_OUTPUT_DIR, "core_legislation")
 LEGISLATION_DIR = os.path.join(SCRAPERS_OUTPUT_DIR, "legislation")
 
+# Act name, optional number and year in a filename such as "Companies Act 71 of 2008"
+_ACT_RE = re.compile(r"(.*?)(?:\s+(?:No\.?\s*)?(\d+))?\s+of\s+(\d{4})", re.IGNORECASE)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_act_filename(filename):
+    """Return (name, number, year, sort key) parsed from a legislation filename.
+    
+    Cached, so a filename seen again (in another directory or a later
+    index run) skips the extension split and regex match.
+    """
+    # Remove file extension
+    base_name = os.path.splitext(filename)[0]
+    
+    # Extract act name, number, and year
+    act_match = _ACT_RE.search(base_name)
+    if act_match:
+        act_name = act_match.group(1).strip()
+        act_number = act_match.group(2) or ""
+        act_year = act_match.group(3)
+        return act_name, act_number, act_year, (act_year, act_name.lower())
+    
+    return base_name, "", "", ("0000", base_name.lower())
+
 class LegislationIndexGenerator:
     """Class to generate a markdown index of legislation."""
     
@@ -48,100 +74,100 @@ class LegislationIndexGenerator:
             "intellectual_property": "Intellectual Property Law",
             "other": "Other Legal Materials"
         }
+        # Category keys by priority, and one pattern finding every key in a
+        # filename in a single scan. The lookahead lets matches overlap.
+        self._category_rank = {category: rank for rank, category in enumerate(self.categories)}
+        self._category_re = re.compile(
+            "(?=(" + "|".join(re.escape(category) for category in self.categories) + "))",
+            # The keys are ASCII, so an ASCII case fold in the regex engine replaces
+            # lowercasing a copy of every filename
+            re.IGNORECASE | re.ASCII
+        )
     
     def extract_act_details(self, filename):
         """Extract act name, number, and year from filename."""
-        # Remove file extension
-        base_name = os.path.splitext(filename)[0]
-        
-        # Extract act name, number, and year
-        act_match = re.search(r"(.*?)(?:\s+(?:No\.?\s*)?(\d+))?\s+of\s+(\d{4})", base_name, re.IGNORECASE)
-        if act_match:
-            act_name = act_match.group(1).strip()
-            act_number = act_match.group(2) or ""
-            act_year = act_match.group(3)
-            
-            return {
-                "name": act_name,
-                "number": act_number,
-                "year": act_year,
-                "filename": filename
-            }
-        
+        name, number, year, sort_key = _parse_act_filename(filename)
         return {
-            "name": base_name,
-            "number": "",
-            "year": "",
-            "filename": filename
+            "name": name,
+            "number": number,
+            "year": year,
+            "filename": filename,
+            # Index order: by year, then by name
+            "sort_key": sort_key
         }
     
     def get_legislation_by_category(self):
         """Get all legislation organized by category."""
-        legislation = {}
+        legislation = defaultdict(list)
         
-        # Initialize categories
-        for category in self.categories.keys():
-            legislation[category] = []
-        
-        # Find core legislation
-        for category in os.listdir(self.core_legislation_dir):
-            category_path = os.path.join(self.core_legislation_dir, category)
-            if os.path.isdir(category_path):
-                if category not in legislation:
-                    legislation[category] = []
+        # Find core legislation. os.scandir entries carry their file type from the
+        # directory listing, so no extra stat() is needed per entry.
+        with os.scandir(self.core_legislation_dir) as category_entries:
+            for category_entry in category_entries:
+                if not category_entry.is_dir():
+                    continue
+                category = category_entry.name
                 
-                for filename in os.listdir(category_path):
-                    if os.path.isfile(os.path.join(category_path, filename)):
-                        legislation[category].append(self.extract_act_details(filename))
+                with os.scandir(category_entry.path) as file_entries:
+                    for file_entry in file_entries:
+                        if file_entry.is_file():
+                            legislation[category].append(self.extract_act_details(file_entry.name))
         
         # Find regular legislation
         if os.path.exists(self.legislation_dir):
-            for filename in os.listdir(self.legislation_dir):
-                file_path = os.path.join(self.legislation_dir, filename)
-                if os.path.isfile(file_path):
+            with os.scandir(self.legislation_dir) as file_entries:
+                for file_entry in file_entries:
+                    if not file_entry.is_file():
+                        continue
+                    filename = file_entry.name
+                    
                     # Determine category based on filename or content
                     # This is a simple approach - you might want to use more sophisticated categorization
-                    category = "other"
-                    for cat in self.categories.keys():
-                        if cat in filename.lower():
-                            category = cat
-                            break
+                    matched = [match.lower() for match in self._category_re.findall(filename)]
+                    category = min(matched, key=self._category_rank.__getitem__) if matched else "other"
                     
                     legislation[category].append(self.extract_act_details(filename))
         
-        return legislation
+        return dict(legislation)
     
     def generate_markdown(self):
         """Generate a markdown file with the legislation index."""
         legislation = self.get_legislation_by_category()
         
-        with open(self.output_file, 'w') as f:
-            f.write("# South African Legislation Index\n\n")
-            f.write(f"*Generated on {datetime.datetime.now().strftime('%Y-%m-%d')}*\n\n")
-            f.write("This document provides an index of all South African legislation in the repository, organized by category.\n\n")
+        # Categories that have legislation, in display order
+        visible = [(category, display_name) for category, display_name in self.categories.items() if legislation.get(category)]
+        
+        # Build the whole document in memory and write it with a single call
+        parts = []
+        append = parts.append
+        append("# South African Legislation Index\n\n")
+        append(f"*Generated on {datetime.datetime.now().strftime('%Y-%m-%d')}*\n\n")
+        append("This document provides an index of all South African legislation in the repository, organized by category.\n\n")
+        
+        append("## Table of Contents\n\n")
+        for category, display_name in visible:
+            append(f"- [{display_name}](#{category.lower().replace('_', '-')})\n")
+        append("\n")
+        
+        for category, display_name in visible:
+            append(f"## {display_name}\n\n")
             
-            f.write("## Table of Contents\n\n")
-            for category, display_name in self.categories.items():
-                if legislation[category]:
-                    f.write(f"- [{display_name}](#{category.lower().replace('_', '-')})\n")
-            f.write("\n")
+            # Sort by year, then by name, using the key computed with the act details
+            sorted_acts = sorted(legislation[category], key=operator.itemgetter("sort_key"))
             
-            for category, display_name in self.categories.items():
-                if legislation[category]:
-                    f.write(f"## {display_name}\n\n")
-                    
-                    # Sort by year, then by name
-                    sorted_acts = sorted(legislation[category], key=lambda x: (x["year"] or "0000", x["name"].lower()))
-                    
-                    f.write("| Act | Number | Year |\n")
-                    f.write("|-----|--------|------|\n")
-                    
-                    for act in sorted_acts:
-                        act_number = f"No. {act['number']}" if act['number'] else ""
-                        act_year = act['year'] or ""
-                        f.write(f"| {act['name']} | {act_number} | {act_year} |\n")
-                    
-                    f.write("\n")
+            append("| Act | Number | Year |\n")
+            append("|-----|--------|------|\n")
+            
+            # Add the category's rows in one extend from a generator
+            parts.extend(
+                "| {} | {} | {} |\n".format(act['name'], f"No. {act['number']}" if act['number'] else "", act['year'] or "")
+                for act in sorted_acts
+            )
+            
+            append("\n")
+        
+        with open(self.output_file, 'w', buffering=1 << 20) as f:
+            f.write("".join(parts))
         
         logger.info(f"Generated legislation index at {self.output_file}")
         return self.output_file
@@ -15,9 +15,16 @@ import argparse
 import shutil
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import re
 
+# orjson serialises the report much faster when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -52,6 +59,53 @@ KEY_LEGISLATION = {
     ]
 }
 
+def _act_pattern(act):
+    """Compile the filename pattern for an act: its name, number and year in either order."""
+    # Filenames replace spaces with underscores, so accept either between words
+    name = re.escape(act['name']).replace(r'\ ', '[ _]')
+    return re.compile(
+        f"{name}.*{act['number']}.*{act['year']}|{act['number']}.*{act['year']}.*{name}",
+        re.IGNORECASE
+    )
+
+# Compile each act's pattern once at import instead of on every filename check
+for _acts in KEY_LEGISLATION.values():
+    for _act in _acts:
+        _act['_pattern'] = _act_pattern(_act)
+
+# One alternation per category, with a named group (a0, a1, ...) per act, so
+# each filename is scanned once for all of the category's acts
+_CATEGORY_PATTERNS = {
+    category: re.compile(
+        "|".join(f"(?P<a{i}>{act['_pattern'].pattern})" for i, act in enumerate(acts)),
+        re.IGNORECASE
+    )
+    for category, acts in KEY_LEGISLATION.items()
+}
+
+def _iter_files(directory):
+    """Yield (directory, filename) for every file below directory, using os.scandir."""
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        yield current, entry.name
+        except OSError:
+            continue
+
+def _count_files(directory):
+    """Count the files below directory, ignoring hidden bookkeeping files.
+    
+    Dotfiles such as the downloader's .collection_keys.json are not dataset
+    documents, so they are left out of the statistics.
+    """
+    return sum(1 for _, filename in _iter_files(directory) if not filename.startswith('.'))
+
 class DocumentOrganizer:
     """Class to handle document organization tasks."""
     
@@ -66,6 +120,9 @@ class DocumentOrganizer:
         # Ensure directories exist
         for directory in [self.core_legislation_dir, self.legislation_dir, self.regulatory_dir]:
             os.makedirs(directory, exist_ok=True)
+        
+        # Destination directories already created by move_file_to_category
+        self._created_dirs = set()
             
         # Statistics
         self.stats = {
@@ -83,19 +140,34 @@ class DocumentOrganizer:
             category_dir = os.path.join(self.core_legislation_dir, category)
             os.makedirs(category_dir, exist_ok=True)
             
-            for act in acts:
-                found = False
-                act_pattern = f"{act['name']}.*{act['number']}.*{act['year']}|{act['number']}.*{act['year']}.*{act['name']}"
-                
-                # Search in core_legislation directory
-                for root, _, files in os.walk(category_dir):
-                    for file in files:
-                        if re.search(act_pattern, file, re.IGNORECASE):
-                            found = True
-                            logger.info(f"Found {act['name']} at {os.path.join(root, file)}")
-                            break
-                
-                if not found:
+            # Walk the category once, matching each filename against all acts at
+            # once and noting where each was first found. The walk stops as soon
+            # as every act has been found, so the rest of the tree is never read.
+            category_files = []
+            found_at = {}
+            combined = _CATEGORY_PATTERNS[category]
+            for root, file in _iter_files(category_dir):
+                category_files.append((root, file))
+                for match in combined.finditer(file):
+                    found_at.setdefault(int(match.lastgroup[1:]), os.path.join(root, file))
+                if len(found_at) == len(acts):
+                    break
+            
+            for i, act in enumerate(acts):
+                path = found_at.get(i)
+                if path is None:
+                    # The combined scan reports one act per match, so confirm a
+                    # miss with the act's own pattern in case another act's name
+                    # overlapped it in the same filename. A miss means the walk
+                    # ran to completion, so category_files holds every file.
+                    path = next(
+                        (os.path.join(root, file) for root, file in category_files if act['_pattern'].search(file)),
+                        None
+                    )
+                if path is not None:
+                    # Per-act hits are debug detail; only missing acts need attention
+                    logger.debug("Found %s at %s", act['name'], path)
+                else:
                     missing_act = f"{act['name']} {act['number']} of {act['year']}"
                     self.stats["missing_core_legislation"].append(missing_act)
                     logger.warning(f"Missing core legislation: {missing_act}")
@@ -106,20 +178,26 @@ class DocumentOrganizer:
         """Analyze the current directory structure and report statistics."""
         logger.info("Analyzing directory structure...")
         
-        # Count files by category
-        for root, _, files in os.walk(self.scrapers_output_dir):
-            for file in files:
-                self.stats["total_files"] += 1
-                
-                # Determine category
-                rel_path = os.path.relpath(root, self.scrapers_output_dir)
-                category = rel_path.split(os.sep)[0] if os.sep in rel_path else rel_path
-                self.stats["category_counts"][category] += 1
-                
-                # Check for unorganized files
-                if root == self.scrapers_output_dir:
+        # Files directly in the output directory are unorganized; each
+        # subdirectory is a category whose tree is counted separately
+        category_dirs = []
+        with os.scandir(self.scrapers_output_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    category_dirs.append(entry)
+                elif entry.is_file() and not entry.name.startswith('.'):
+                    self.stats["total_files"] += 1
+                    self.stats["category_counts"]["."] += 1
                     self.stats["unorganized_files"] += 1
         
+        # Walk the category trees in parallel; the directory syscalls release the GIL
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            counts = executor.map(_count_files, [entry.path for entry in category_dirs])
+            for entry, count in zip(category_dirs, counts):
+                if count:
+                    self.stats["total_files"] += count
+                    self.stats["category_counts"][entry.name] += count
+        
         return self.stats
     
     def generate_report(self, output_file=None):
@@ -176,8 +254,12 @@ class DocumentOrganizer:
         
         # Save report if requested
         if output_file:
-            with open(output_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            if orjson is not None:
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w') as f:
+                    json.dump(report, f, indent=2)
             logger.info(f"Report saved to {output_file}")
         
         return report
@@ -188,10 +270,17 @@ class DocumentOrganizer:
         if subcategory:
             dest_dir = os.path.join(dest_dir, subcategory)
         
-        os.makedirs(dest_dir, exist_ok=True)
+        if dest_dir not in self._created_dirs:
+            os.makedirs(dest_dir, exist_ok=True)
+            self._created_dirs.add(dest_dir)
         dest_path = os.path.join(dest_dir, os.path.basename(file_path))
         
-        shutil.move(file_path, dest_path)
+        # A rename is a single syscall when both paths are on one filesystem;
+        # shutil.move is only needed to copy across devices
+        try:
+            os.replace(file_path, dest_path)
+        except OSError:
+            shutil.move(file_path, dest_path)
         logger.info(f"Moved {file_path} to {dest_path}")
 
 def main():
@@ -14,13 +14,14 @@ This script implements various technical processing requirements for legal docum
 import os
 import sys
 import re
+import string
 import argparse
 import json
 import logging
 import concurrent.futures
+import io
 from pathlib import Path
 from tqdm import tqdm
-import spacy
 import pandas as pd
 from datetime import datetime
 import PyPDF2
@@ -34,6 +35,17 @@ from nltk.stem import WordNetLemmatizer
 import networkx as nx
 import pickle
 
+try:
+    import gcld3
+except ImportError:
+    gcld3 = None
+
+# orjson serialises the per-document results much faster when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -48,6 +60,29 @@ INPUT_DIR = os.path.join(BASE_DIR, "scrapers_output")
 OUTPUT_DIR = os.path.join(BASE_DIR, "processed_output")
 MODELS_DIR = os.path.join(BASE_DIR, "models")
 
+# RTF control words, braces, stray backslashes and separators
+RTF_CONTROL_RE = re.compile(r'\\[a-z0-9]+|\{|\}|\\|;')
+
+def _warm_page_cache(path):
+    """Ask the kernel to start reading path into the page cache in the background.
+    
+    Called as each file is queued, so that by the time a worker opens it the
+    data is usually already in memory. Does nothing where posix_fadvise is
+    unavailable or the file cannot be opened.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 # Create necessary directories
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(MODELS_DIR, exist_ok=True)
@@ -67,17 +102,23 @@ try:
 except Exception as e:
     logger.warning(f"Error downloading NLTK resources: {e}")
 
-# Try to load spaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except Exception as e:
-    logger.warning(f"Could not load spaCy model: {e}. Will try to download.")
-    try:
-        os.system("python -m spacy download en_core_web_sm")
-        nlp = spacy.load("en_core_web_sm")
-    except Exception as e2:
-        logger.error(f"Failed to load spaCy model after attempted download: {e2}")
-        nlp = None
+# Common words in South African languages, used for language detection
+LANGUAGE_WORDS = {
+    "en": ["the", "and", "of", "to", "a", "in", "that", "is"],
+    "af": ["die", "en", "van", "in", "is", "het", "nie", "dat"],
+    "zu": ["ukuthi", "umuntu", "futhi", "ngokuthi", "ngoba", "uma"],
+    "xh": ["ukuba", "kunye", "ukuze", "umtu", "kodwa", "kuba"],
+    "st": ["hore", "le", "ka", "ho", "ke", "ha", "tse", "ya"],
+    "tn": ["gore", "le", "ka", "go", "ke", "ga", "tse", "ya"],
+    "nso": ["gore", "le", "ka", "go", "ke", "ga", "tše", "ya"],
+    "ts": ["ku", "na", "ni", "va", "swi", "laha", "loko", "kambe"],
+    "ss": ["kutsi", "uma", "naloku", "ngoba", "kuze", "kantsi"],
+    "ve": ["uri", "na", "vha", "nga", "kha", "ha", "ndi", "hu"],
+    "nr": ["bona", "ukuthi", "lokhu", "lapho", "uma", "ngakho"]
+}
+
+# Neural language identifier, used when gcld3 is installed
+_DETECTOR = gcld3.NNetLanguageIdentifier(min_num_bytes=0, max_num_bytes=1000) if gcld3 else None
 
 class LegalDocumentProcessor:
     """Class to process South African legal documents for LLM training."""
@@ -176,15 +217,47 @@ class LegalDocumentProcessor:
                 r'stare decisis'
             ]
         }
+        
+        # Precompile the patterns once rather than on every call
+        self._citation_res = [
+            (pattern, re.compile(pattern, re.IGNORECASE))
+            for pattern in self.citation_patterns
+        ]
+        self._structure_res = {
+            struct_type: re.compile(pattern)
+            for struct_type, pattern in self.structure_patterns.items()
+        }
+        
+        # Characters each structure pattern can start a (stripped) line with.
+        # Lines are dispatched on their first character to only the patterns
+        # that could match it, keeping the original pattern priority
+        structure_first_chars = {
+            "heading": string.ascii_uppercase + string.digits + ".,;:'\"&()[]{}#*-",
+            "section": string.digits + "(",
+            "subsection": "(",
+            "paragraph": string.ascii_lowercase,
+            "subparagraph": "(",
+            "definition": '"',
+            "table_header": "|",
+            "list_item": "•",
+            "footnote": string.digits,
+            "preamble": "P",
+            "endnote": "EN"
+        }
+        self._structure_by_first = {}
+        for struct_type, pattern in self._structure_res.items():
+            for char in structure_first_chars[struct_type]:
+                self._structure_by_first.setdefault(char, []).append((struct_type, pattern))
+        self._reasoning_res = {
+            reasoning_type: [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in patterns]
+            for reasoning_type, patterns in self.reasoning_patterns.items()
+        }
     
     def extract_text_from_pdf(self, pdf_path):
         """Extract text from a PDF file using PyMuPDF (fitz)."""
-        text = ""
         try:
             doc = fitz.open(pdf_path)
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text += page.get_text()
+            text = "".join([page.get_text() for page in doc])
             doc.close()
             return text
         except Exception as e:
@@ -194,9 +267,7 @@ class LegalDocumentProcessor:
             try:
                 with open(pdf_path, 'rb') as file:
                     reader = PyPDF2.PdfReader(file)
-                    text = ""
-                    for page in reader.pages:
-                        text += page.extract_text() or ""
+                    text = "".join([page.extract_text() or "" for page in reader.pages])
                 return text
             except Exception as e2:
                 logger.error(f"Error extracting text with PyPDF2 as well: {e2}")
@@ -233,10 +304,8 @@ class LegalDocumentProcessor:
                 # For RTF, we can use a simpler approach with regex to strip RTF codes
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
                     rtf_text = f.read()
-                    # Remove RTF control codes
-                    clean_text = re.sub(r'\\[a-z0-9]+', ' ', rtf_text)
-                    clean_text = re.sub(r'\{|\}|\\|;', ' ', clean_text)
-                    return clean_text
+                    # Remove RTF control codes and braces in a single pass
+                    return RTF_CONTROL_RE.sub(' ', rtf_text)
             except Exception as e:
                 logger.error(f"Error extracting text from RTF {file_path}: {e}")
                 return ""
@@ -249,9 +318,8 @@ class LegalDocumentProcessor:
         citations = []
         
         # Extract citations using predefined patterns
-        for pattern in self.citation_patterns:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
+        for pattern, pattern_re in self._citation_res:
+            for match in pattern_re.finditer(text):
                 citation = {
                     "text": match.group(0),
                     "start": match.start(),
@@ -264,36 +332,41 @@ class LegalDocumentProcessor:
         return citations
     
     def analyze_document_structure(self, text, doc_id):
-        """Analyze the structure of a legal document."""
-        structure = {
-            "document_id": doc_id,
-            "elements": []
-        }
+        """Analyze the structure of a legal document.
         
-        # Split text into lines for structure analysis
-        lines = text.split('\n')
+        Elements are stored column-wise: the i-th entries of line_numbers,
+        texts and types together describe one element.
+        """
+        line_numbers = []
+        texts = []
+        types = []
         
-        for i, line in enumerate(lines):
+        # Iterate over the lines lazily rather than splitting the whole text
+        for i, line in enumerate(io.StringIO(text, newline='\n')):
             line = line.strip()
             if not line:
                 continue
             
             # Identify the type of structural element
             element_type = "text"  # Default
-            for struct_type, pattern in self.structure_patterns.items():
-                if re.match(pattern, line):
+            first = line[0]
+            if first.isdecimal() and first not in self._structure_by_first:
+                first = "0"  # Non-ASCII digits also match \d
+            for struct_type, pattern in self._structure_by_first.get(first, ()):
+                if pattern.match(line):
                     element_type = struct_type
                     break
             
-            element = {
-                "line_number": i,
-                "text": line,
-                "type": element_type
-            }
-            
-            structure["elements"].append(element)
+            line_numbers.append(i)
+            texts.append(line)
+            types.append(element_type)
         
-        return structure
+        return {
+            "document_id": doc_id,
+            "line_numbers": line_numbers,
+            "texts": texts,
+            "types": types
+        }
     
     def map_cross_references(self, citations, doc_id):
         """Map cross-references between documents based on citations."""
@@ -400,30 +473,20 @@ class LegalDocumentProcessor:
     
     def detect_language(self, text):
         """Detect the language of text."""
-        # Simple language detection based on common words
-        # For a production system, use a proper language detection library
+        # gcld3 is preferred when installed; its answer is only trusted when
+        # reliable and one of the South African languages handled here
+        sample = text[:1000]
+        if _DETECTOR is not None:
+            result = _DETECTOR.FindLanguage(text=sample)
+            if result.is_reliable and result.language in LANGUAGE_WORDS:
+                return result.language
+        
+        # Otherwise fall back to simple detection based on common words
         language_scores = {}
-        
-        # Short sample for performance
-        sample = text[:1000].lower()
-        
-        # Common words in South African languages
-        language_words = {
-            "en": ["the", "and", "of", "to", "a", "in", "that", "is"],
-            "af": ["die", "en", "van", "in", "is", "het", "nie", "dat"],
-            "zu": ["ukuthi", "umuntu", "futhi", "ngokuthi", "ngoba", "uma"],
-            "xh": ["ukuba", "kunye", "ukuze", "umtu", "kodwa", "kuba"],
-            "st": ["hore", "le", "ka", "ho", "ke", "ha", "tse", "ya"],
-            "tn": ["gore", "le", "ka", "go", "ke", "ga", "tse", "ya"],
-            "nso": ["gore", "le", "ka", "go", "ke", "ga", "tše", "ya"],
-            "ts": ["ku", "na", "ni", "va", "swi", "laha", "loko", "kambe"],
-            "ss": ["kutsi", "uma", "naloku", "ngoba", "kuze", "kantsi"],
-            "ve": ["uri", "na", "vha", "nga", "kha", "ha", "ndi", "hu"],
-            "nr": ["bona", "ukuthi", "lokhu", "lapho", "uma", "ngakho"]
-        }
+        sample = sample.lower()
         
         # Count word occurrences
-        for lang, words in language_words.items():
+        for lang, words in LANGUAGE_WORDS.items():
             score = 0
             for word in words:
                 score += len(re.findall(r'\b' + re.escape(word) + r'\b', sample))
@@ -446,16 +509,16 @@ class LegalDocumentProcessor:
             "patterns": {}
         }
         
+        # Split text into sentences for context, once for all reasoning types
+        sentences = sent_tokenize(text)
+        
         # For each reasoning type, find matches of its patterns
-        for reasoning_type, patterns in self.reasoning_patterns.items():
+        for reasoning_type, patterns in self._reasoning_res.items():
             reasoning["patterns"][reasoning_type] = []
             
-            # Split text into sentences for context
-            sentences = sent_tokenize(text)
-            
-            for pattern in patterns:
+            for pattern, pattern_re in patterns:
                 for i, sentence in enumerate(sentences):
-                    if re.search(pattern, sentence, re.IGNORECASE):
+                    if pattern_re.search(sentence):
                         # Get context (previous and next sentence if available)
                         prev_sent = sentences[i-1] if i > 0 else ""
                         next_sent = sentences[i+1] if i < len(sentences)-1 else ""
@@ -505,8 +568,8 @@ class LegalDocumentProcessor:
                 "language": language,
                 "citation_count": len(citations),
                 "structure": {
-                    "elements_count": len(structure["elements"]),
-                    "element_types": self.count_element_types(structure["elements"])
+                    "elements_count": len(structure["types"]),
+                    "element_types": self.count_element_types(structure["types"])
                 },
                 "cross_references": len(cross_refs["references"]),
                 "reasoning_patterns": {rt: len(patterns) for rt, patterns in reasoning["patterns"].items()}
@@ -545,31 +608,48 @@ class LegalDocumentProcessor:
         else:
             return "unknown"
     
-    def count_element_types(self, elements):
+    def count_element_types(self, element_types):
         """Count the frequency of each element type in the document structure."""
         counts = {}
-        for element in elements:
-            element_type = element["type"]
+        for element_type in element_types:
             counts[element_type] = counts.get(element_type, 0) + 1
         return counts
     
+    def _write_json(self, path, data):
+        """Write data as indented JSON, using orjson when it is installed."""
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+    
     def save_processing_results(self, doc_id, results):
         """Save detailed processing results to separate files."""
         # Citations
-        with open(os.path.join(self.output_dir, "citations", f"{doc_id}_citations.json"), 'w', encoding='utf-8') as f:
-            json.dump(results["citations"], f, indent=2)
+        self._write_json(os.path.join(self.output_dir, "citations", f"{doc_id}_citations.json"), results["citations"])
         
         # Structure
-        with open(os.path.join(self.output_dir, "structure", f"{doc_id}_structure.json"), 'w', encoding='utf-8') as f:
-            json.dump(results["structure"], f, indent=2)
+        self._write_json(os.path.join(self.output_dir, "structure", f"{doc_id}_structure.json"), results["structure"])
         
         # Cross-references
-        with open(os.path.join(self.output_dir, "cross_references", f"{doc_id}_xrefs.json"), 'w', encoding='utf-8') as f:
-            json.dump(results["cross_references"], f, indent=2)
+        self._write_json(os.path.join(self.output_dir, "cross_references", f"{doc_id}_xrefs.json"), results["cross_references"])
         
         # Reasoning
-        with open(os.path.join(self.output_dir, "reasoning", f"{doc_id}_reasoning.json"), 'w', encoding='utf-8') as f:
-            json.dump(results["reasoning"], f, indent=2)
+        self._write_json(os.path.join(self.output_dir, "reasoning", f"{doc_id}_reasoning.json"), results["reasoning"])
+    
+    def _collect_results(self, futures, future_to_file, documents, progress):
+        """Record the results of finished processing futures."""
+        for future in futures:
+            file = future_to_file.pop(future)
+            try:
+                result = future.result()
+                if result:
+                    doc_id, doc_info = result
+                    documents[doc_id] = doc_info
+            except Exception as e:
+                logger.error(f"Error processing file {file}: {e}")
+            progress.update(1)
     
     def process_directory(self, directory, max_files=None):
         """Process all legal documents in a directory and its subdirectories."""
@@ -592,26 +672,31 @@ class LegalDocumentProcessor:
         
         # Process files concurrently
         documents = {}
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            future_to_file = {executor.submit(self.process_file, file): file for file in document_files}
-            
-            for future in tqdm(concurrent.futures.as_completed(future_to_file), total=len(document_files), desc="Processing documents"):
-                file = future_to_file[future]
-                try:
-                    result = future.result()
-                    if result:
-                        doc_id, doc_info = result
-                        documents[doc_id] = doc_info
-                except Exception as e:
-                    logger.error(f"Error processing file {file}: {e}")
+        max_in_flight = 2 * (os.cpu_count() or 1)
+        with concurrent.futures.ProcessPoolExecutor() as executor, \
+                tqdm(total=len(document_files), desc="Processing documents") as progress:
+            future_to_file = {}
+            
+            # Keep a bounded number of files queued on the workers, warming the
+            # page cache for each as it is queued so its read overlaps the
+            # processing of the files ahead of it
+            for file in document_files:
+                _warm_page_cache(file)
+                future_to_file[executor.submit(self.process_file, file)] = file
+                if len(future_to_file) >= max_in_flight:
+                    done, _ = concurrent.futures.wait(future_to_file, return_when=concurrent.futures.FIRST_COMPLETED)
+                    self._collect_results(done, future_to_file, documents, progress)
+            
+            self._collect_results(concurrent.futures.as_completed(list(future_to_file)), future_to_file, documents, progress)
         
         # Additional processing on the complete document collection
         if documents:
             # Model legal hierarchy
             hierarchy_graph = self.model_legal_hierarchy(documents)
             
-            # Save the hierarchy graph
-            nx.write_gpickle(hierarchy_graph, os.path.join(self.output_dir, "hierarchy", "legal_hierarchy.gpickle"))
+            # Save the hierarchy graph (nx.write_gpickle was removed in NetworkX 3.0)
+            with open(os.path.join(self.output_dir, "hierarchy", "legal_hierarchy.gpickle"), 'wb') as f:
+                pickle.dump(hierarchy_graph, f, protocol=pickle.HIGHEST_PROTOCOL)
             
             # Export a simple representation as JSON
             hierarchy_data = {
@@ -1,109 +1,155 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import os
 import json
+import hashlib
 import logging
-from bs4 import BeautifulSoup
-from concurrent.futures import ThreadPoolExecutor
-from pathlib import Path
+import argparse
+import threading
+import lxml.etree
+import lxml.html
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from time import sleep
 from datetime import datetime
+from urllib.parse import urlparse
+
+# Simultaneous downloads allowed against any one host
+MAX_REQUESTS_PER_HOST = 2
+# Write buffer for downloaded files, so large PDFs need few write() calls
+WRITE_BUFFER_SIZE = 1 << 20
+# Size of the chunks each download reads the response body in
+READ_CHUNK_SIZE = 1 << 20
+# Links whose href ends in '.pdf', selected inside libxml2 rather than in Python
+PDF_LINK_XPATH = lxml.etree.XPath("//a/@href[substring(., string-length(.) - 3) = '.pdf']")
+
+# Core legislation to download, by category, shared by every downloader instance
+CORE_LEGISLATION = {
+    "constitutional": {
+        "Constitution of South Africa": {
+            "number": "108",
+            "year": "1996",
+            "url": "https://www.gov.za/sites/default/files/gcis_document/201409/act108of1996s.pdf"
+        }
+    },
+    "criminal": {
+        "Criminal Procedure Act": {
+            "number": "51",
+            "year": "1977",
+            "url": "https://www.justice.gov.za/legislation/acts/1977-051.pdf"
+        }
+    },
+    "labour": {
+        "Labour Relations Act": {
+            "number": "66",
+            "year": "1995",
+            "url": "https://www.gov.za/sites/default/files/gcis_document/201409/act66-1995labourrelations.pdf"
+        }
+    },
+    "commercial": {
+        "Companies Act": {
+            "number": "71",
+            "year": "2008",
+            "url": "https://www.gov.za/documents/companies-act"
+        },
+        "Consumer Protection Act": {
+            "number": "68",
+            "year": "2008",
+            "url": "https://www.gov.za/documents/consumer-protection-act"
+        },
+        "Competition Act": {
+            "number": "89",
+            "year": "1998",
+            "url": "https://www.gov.za/documents/competition-act"
+        },
+        "National Credit Act": {
+            "number": "34",
+            "year": "2005",
+            "url": "https://www.gov.za/documents/national-credit-act"
+        }
+    },
+    "financial": {
+        "Financial Intelligence Centre Act": {
+            "number": "38",
+            "year": "2001",
+            "url": "https://www.gov.za/documents/financial-intelligence-centre-act"
+        },
+        "Financial Advisory and Intermediary Services Act": {
+            "number": "37",
+            "year": "2002",
+            "url": "https://www.gov.za/documents/financial-advisory-and-intermediary-services-act"
+        },
+        "Banks Act": {
+            "number": "94",
+            "year": "1990",
+            "url": "https://static.pmg.org.za/files/B94-1990.pdf"
+        }
+    },
+    "regulatory": {
+        "Protection of Personal Information Act": {
+            "number": "4",
+            "year": "2013",
+            "url": "https://www.gov.za/documents/protection-personal-information-act"
+        },
+        "Promotion of Administrative Justice Act": {
+            "number": "3",
+            "year": "2000",
+            "url": "https://www.gov.za/documents/promotion-administrative-justice-act"
+        },
+        "Broad-Based Black Economic Empowerment Act": {
+            "number": "53",
+            "year": "2003",
+            "url": "https://www.gov.za/documents/broad-based-black-economic-empowerment-act"
+        }
+    }
+}
 
 class CoreLegislationDownloader:
-    def __init__(self, output_dir="scrapers_output/core_legislation", max_workers=2, delay=2):
+    def __init__(self, output_dir="scrapers_output/core_legislation", max_workers=8, delay=2, revalidate=False):
         self.output_dir = output_dir
         self.max_workers = max_workers
         self.delay = delay
+        # Re-request existing files, letting the server answer 304 if they are unchanged
+        self.revalidate = revalidate
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            # Compressed landing pages, in every encoding urllib3 can decode here
+            **make_headers(accept_encoding=True)
         })
         
+        # Reuse TLS connections per host and retry transient server errors on them
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Per-host download limits shared by the worker threads
+        self.host_slots = {}
+        self.host_slots_lock = threading.Lock()
+        
+        # ETag / Last-Modified of previously downloaded files, keyed by URL
+        self.validators_file = os.path.join(self.output_dir, ".download_cache.json")
+        self.validators = self.load_json(self.validators_file)
+        self.validators_lock = threading.Lock()
+        
+        # SHA-256 of downloaded files mapped to their path, to hardlink duplicates
+        self.hashes_file = os.path.join(self.output_dir, ".download_hashes.json")
+        self.hashes = self.load_json(self.hashes_file)
+        self.hashes_lock = threading.Lock()
+        
         # Set up logging
         self.setup_logging()
         
+        # Core legislation to download - gov.za only
+        self.core_legislation = CORE_LEGISLATION
+        
         # Create output directories
         self.create_directories()
-        
-        # Define core legislation to download - gov.za only
-        self.core_legislation = {
-            "constitutional": {
-                "Constitution of South Africa": {
-                    "number": "108",
-                    "year": "1996",
-                    "url": "https://www.gov.za/sites/default/files/gcis_document/201409/act108of1996s.pdf"
-                }
-            },
-            "criminal": {
-                "Criminal Procedure Act": {
-                    "number": "51",
-                    "year": "1977",
-                    "url": "https://www.justice.gov.za/legislation/acts/1977-051.pdf"
-                }
-            },
-            "labour": {
-                "Labour Relations Act": {
-                    "number": "66",
-                    "year": "1995",
-                    "url": "https://www.gov.za/sites/default/files/gcis_document/201409/act66-1995labourrelations.pdf"
-                }
-            },
-            "commercial": {
-                "Companies Act": {
-                    "number": "71",
-                    "year": "2008",
-                    "url": "https://www.gov.za/documents/companies-act"
-                },
-                "Consumer Protection Act": {
-                    "number": "68",
-                    "year": "2008",
-                    "url": "https://www.gov.za/documents/consumer-protection-act"
-                },
-                "Competition Act": {
-                    "number": "89",
-                    "year": "1998",
-                    "url": "https://www.gov.za/documents/competition-act"
-                },
-                "National Credit Act": {
-                    "number": "34",
-                    "year": "2005",
-                    "url": "https://www.gov.za/documents/national-credit-act"
-                }
-            },
-            "financial": {
-                "Financial Intelligence Centre Act": {
-                    "number": "38",
-                    "year": "2001",
-                    "url": "https://www.gov.za/documents/financial-intelligence-centre-act"
-                },
-                "Financial Advisory and Intermediary Services Act": {
-                    "number": "37",
-                    "year": "2002",
-                    "url": "https://www.gov.za/documents/financial-advisory-and-intermediary-services-act"
-                },
-                "Banks Act": {
-                    "number": "94",
-                    "year": "1990",
-                    "url": "https://static.pmg.org.za/files/B94-1990.pdf"
-                }
-            },
-            "regulatory": {
-                "Protection of Personal Information Act": {
-                    "number": "4",
-                    "year": "2013",
-                    "url": "https://www.gov.za/documents/protection-personal-information-act"
-                },
-                "Promotion of Administrative Justice Act": {
-                    "number": "3",
-                    "year": "2000",
-                    "url": "https://www.gov.za/documents/promotion-administrative-justice-act"
-                },
-                "Broad-Based Black Economic Empowerment Act": {
-                    "number": "53",
-                    "year": "2003",
-                    "url": "https://www.gov.za/documents/broad-based-black-economic-empowerment-act"
-                }
-            }
-        }
 
     def setup_logging(self):
         """Set up logging configuration"""
@@ -136,33 +182,111 @@ class CoreLegislationDownloader:
 
     def create_directories(self):
         """Create necessary directories for downloads"""
-        for category in ["commercial", "financial", "regulatory"]:
-            Path(f"{self.output_dir}/{category}").mkdir(parents=True, exist_ok=True)
+        # Create the parents once, then one mkdir per category directory
+        os.makedirs(self.output_dir, exist_ok=True)
+        for category in self.core_legislation:
+            try:
+                os.mkdir(os.path.join(self.output_dir, category))
+            except FileExistsError:
+                pass
+
+    def load_json(self, path):
+        """Load a JSON cache saved by a previous run, or an empty one"""
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_json(self, path, data, lock):
+        """Persist a JSON cache for the next run"""
+        try:
+            with lock:
+                with open(path, 'w') as f:
+                    json.dump(data, f, indent=2, sort_keys=True)
+        except OSError as e:
+            logging.warning(f"Failed to save {path}: {str(e)}")
+
+    def link_duplicate(self, output_path, digest):
+        """Replace a download with a hardlink if the same content was downloaded before"""
+        with self.hashes_lock:
+            # Forget the digest of whatever was previously downloaded to this path
+            for stale in [d for d, path in self.hashes.items() if path == output_path and d != digest]:
+                del self.hashes[stale]
+            existing = self.hashes.get(digest)
+            if not existing or not os.path.exists(existing):
+                self.hashes[digest] = output_path
+                return
+        
+        if os.path.samefile(existing, output_path):
+            return
+        try:
+            link_path = output_path + '.link'
+            os.link(existing, link_path)
+            os.replace(link_path, output_path)
+            logging.info(f"Linked {output_path} to identical file {existing}")
+        except OSError as e:
+            logging.warning(f"Could not hardlink {output_path} to {existing}: {str(e)}")
 
     def download_file(self, url, output_path):
         """Download a file from URL and save to output path"""
         try:
             logging.info(f"Attempting to download {url}")
-            response = self.session.get(url, stream=True, timeout=60)
+            
+            # Ask for the body only if it changed since the copy we already have
+            headers = {}
+            if os.path.exists(output_path):
+                with self.validators_lock:
+                    cached = self.validators.get(url, {})
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
+            response = self.session.get(url, headers=headers, stream=True, timeout=60)
+            if response.status_code == 304:
+                logging.info(f"Unchanged since last download: {output_path}")
+                return True
             response.raise_for_status()
             
             content_type = response.headers.get('content-type', '')
             if 'pdf' not in content_type.lower():
                 logging.warning(f"Warning: Content-Type is not PDF: {content_type}")
             
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
+            # Stream into a partial file next to the target, so an interrupted
+            # download never looks like an existing file to the next run
+            part_path = output_path + '.part'
+            try:
+                # Read the decoded body in large chunks; raw.readinto is avoided
+                # because urllib3 1.26 can overrun the buffer on compressed bodies
+                digest = hashlib.sha256()
+                with open(part_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    for chunk in response.iter_content(chunk_size=READ_CHUNK_SIZE):
                         f.write(chunk)
-            
-            # Verify file was downloaded
-            if os.path.getsize(output_path) > 0:
-                logging.info(f"Successfully downloaded {url} to {output_path}")
-                return True
-            else:
-                logging.error(f"Downloaded file is empty: {output_path}")
-                os.remove(output_path)
-                return False
+                        digest.update(chunk)
+                
+                # Verify file was downloaded
+                if os.path.getsize(part_path) > 0:
+                    os.replace(part_path, output_path)
+                    logging.info(f"Successfully downloaded {url} to {output_path}")
+                    self.link_duplicate(output_path, digest.hexdigest())
+                    
+                    validators = {
+                        'etag': response.headers.get('ETag'),
+                        'last_modified': response.headers.get('Last-Modified')
+                    }
+                    if any(validators.values()):
+                        with self.validators_lock:
+                            self.validators[url] = validators
+                    return True
+                else:
+                    logging.error(f"Downloaded file is empty: {output_path}")
+                    return False
+            finally:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
                 
         except requests.exceptions.Timeout:
             logging.error(f"Timeout downloading {url}")
@@ -181,10 +305,11 @@ class CoreLegislationDownloader:
             response = self.session.get(page_url, timeout=60)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Parse the raw bytes so lxml can detect the page encoding itself
+            tree = lxml.html.fromstring(response.content)
             
             # Look for PDF download link
-            pdf_links = soup.find_all('a', href=lambda x: x and x.endswith('.pdf'))
+            pdf_links = PDF_LINK_XPATH(tree)
             
             if not pdf_links:
                 logging.error(f"No PDF links found on {page_url}")
@@ -192,10 +317,10 @@ class CoreLegislationDownloader:
                 
             # Log all found PDF links
             for link in pdf_links:
-                logging.info(f"Found PDF link: {link['href']}")
+                logging.info(f"Found PDF link: {link}")
             
             # Use the first PDF link found
-            return pdf_links[0]['href']
+            return str(pdf_links[0])
             
         except requests.exceptions.Timeout:
             logging.error(f"Timeout accessing {page_url}")
@@ -207,13 +332,27 @@ class CoreLegislationDownloader:
             logging.error(f"Unexpected error processing {page_url}: {str(e)}")
             return None
 
+    def host_slot(self, url):
+        """Return the semaphore limiting concurrent downloads from the URL's host"""
+        host = urlparse(url).netloc
+        with self.host_slots_lock:
+            slot = self.host_slots.get(host)
+            if slot is None:
+                slot = self.host_slots[host] = threading.BoundedSemaphore(MAX_REQUESTS_PER_HOST)
+        return slot
+
     def download_legislation(self, category, name, details):
         """Download legislation from source"""
+        with self.host_slot(details['url']):
+            self.fetch_legislation(category, name, details)
+
+    def fetch_legislation(self, category, name, details):
+        """Fetch one piece of legislation, pausing afterwards to be polite to its host"""
         try:
             output_filename = f"{name.replace(' ', '_')}_{details['number']}_{details['year']}.pdf"
             output_path = f"{self.output_dir}/{category}/{output_filename}"
             
-            if os.path.exists(output_path):
+            if os.path.exists(output_path) and not self.revalidate:
                 logging.info(f"File already exists: {output_path}")
                 return
             
@@ -236,17 +375,31 @@ class CoreLegislationDownloader:
         """Run the downloader for all legislation"""
         try:
             logging.info("Starting download process...")
+            # Submit every act at once; the per-host slots keep each server's load bounded
             with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {}
                 for category, acts in self.core_legislation.items():
                     logging.info(f"Processing category: {category}")
                     for name, details in acts.items():
-                        executor.submit(self.download_legislation, category, name, details)
-                        sleep(self.delay)
+                        futures[executor.submit(self.download_legislation, category, name, details)] = name
+                
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logging.error(f"Error processing {futures[future]}: {str(e)}")
+            self.save_json(self.validators_file, self.validators, self.validators_lock)
+            self.save_json(self.hashes_file, self.hashes, self.hashes_lock)
             logging.info("Download process completed")
             
         except Exception as e:
             logging.error(f"Error in run process: {str(e)}")
 
 if __name__ == "__main__":
-    downloader = CoreLegislationDownloader()
+    parser = argparse.ArgumentParser(description="Download core South African legislation from gov.za")
+    parser.add_argument("--revalidate", action="store_true",
+                        help="Re-check existing files with conditional requests and refresh changed ones")
+    args = parser.parse_args()
+    
+    downloader = CoreLegislationDownloader(revalidate=args.revalidate)
     downloader.run() 
\ No newline at end of file